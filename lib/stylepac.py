@@ -1,20 +1,14 @@
 #!/bin/python3
+import re
 
-lines = open("/etc/pacman.conf").readlines()
-new = []
-has_candy = any("ILoveCandy" in line for line in lines)
+with open("/etc/pacman.conf") as f:
+    original = f.read()
 
-for line in lines:
-    s = line.strip()
+text = re.sub(r"(?m)^#Color[ \t]*$", "Color", original)
 
-    if s == "#Color":
-        new.append("Color\n")
-        continue
+if "ILoveCandy" not in text:
+    text = re.sub(r"(?m)^# Misc options[ \t]*$", "# Misc options\nILoveCandy", text, count=1)
 
-    if s == "# Misc options" and not has_candy:
-        new += [line, "ILoveCandy\n"]
-        continue
-
-    new.append(line)
-
-open("/etc/pacman.conf", "w").writelines(new)
+if text != original:
+    with open("/etc/pacman.conf", "w") as f:
+        f.write(text)
@@ -4,23 +4,188 @@ import threading
 import os
 import sys
 import re
+import shlex
+import shutil
 import signal
+import functools
+import collections
+import json
+import concurrent.futures
 from difflib import SequenceMatcher
+try:
+    import pyalpm  # libalpm bindings: read the pacman dbs in-process when available
+except ImportError:
+    pyalpm = None
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 gi.require_version('Vte', '3.91')
 
-from gi.repository import Gtk, Adw, GLib, Vte, Gdk, Pango  # noqa: E402
+from gi.repository import Gtk, Adw, GLib, Gio, GObject, Vte, Gdk, Pango  # noqa: E402
 
-def check_pacman_contrib():
-    """Check if pacman-contrib is installed (provides pactree for dependency analysis)"""
+# Helper scripts shipped alongside main.py, resolved once
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+_GRIMAUR_PATH = os.path.join(_APP_DIR, 'grimaur-too', 'grimaur.py')
+_STYLEPAC_PATH = os.path.join(_APP_DIR, 'lib', 'stylepac.py')
+
+_INSTALLED_CACHE = None
+_INSTALLED_LOCK = threading.Lock()
+_SYNC_CACHE = None
+_SYNC_LOCK = threading.Lock()
+
+def _pacman_db_stamp(path):
+    """
+    Get (name, mtime_ns) for path and each entry in it.
+    Changes whenever pacman rewrites a sync db or adds/removes a local package.
+    """
+    try:
+        stamp = [(path, os.stat(path).st_mtime_ns)]
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.db'):
+                    stamp.append((entry.name, entry.stat().st_mtime_ns))
+    except OSError:
+        return None
+    return tuple(sorted(stamp))
+
+def invalidate_installed_cache():
+    """Forget the cached installed set so the next lookup re-queries pacman"""
+    global _INSTALLED_CACHE
+    _INSTALLED_CACHE = None
+
+def installed_package_set():
+    """
+    Get the names of all installed packages, from the local db via pyalpm or
+    else a single `pacman -Qq` call.
+    The result is cached until the local db changes or invalidate_installed_cache()
+    is called.
+    """
+    global _INSTALLED_CACHE
+    # load_packages' loaders can ask concurrently; let one of them run pacman -Qq
+    with _INSTALLED_LOCK:
+        stamp = _pacman_db_stamp('/var/lib/pacman/local')
+        if _INSTALLED_CACHE is None or stamp is None or _INSTALLED_CACHE[0] != stamp:
+            installed = _alpm_installed_names()
+            if installed is None:
+                try:
+                    # One decode for the whole (small, names-only) output instead of one per line
+                    with subprocess.Popen(['pacman', '-Qq'], stdout=subprocess.PIPE) as proc:
+                        installed = frozenset(proc.stdout.read().decode().split())
+                except (FileNotFoundError, OSError):
+                    return frozenset()
+                if proc.returncode != 0:
+                    return frozenset()
+            _INSTALLED_CACHE = (stamp, installed)
+        return _INSTALLED_CACHE[1]
+
+def sync_package_list():
+    """
+    Get (name, repo) for every package in the sync dbs, via pyalpm or else `pacman -Sl`.
+    The parsed list is reused (in memory, and across runs via the disk cache) until
+    a sync db or pacman.conf changes, so reloads and restarts skip re-reading tens
+    of thousands of lines.
+    Raises CalledProcessError if pacman fails.
+    """
+    global _SYNC_CACHE
+    # load_packages' loaders can ask concurrently; let one of them run pacman -Sl
+    with _SYNC_LOCK:
+        stamp = _pacman_db_stamp('/var/lib/pacman/sync')
+        try:
+            # Disabling a repo in pacman.conf hides it from -Sl without touching its db
+            stamp = stamp and stamp + (('/etc/pacman.conf', os.stat('/etc/pacman.conf').st_mtime_ns),)
+        except OSError:
+            stamp = None
+        if _SYNC_CACHE is None or stamp is None or _SYNC_CACHE[0] != stamp:
+            # A previous run may already have listed these exact db files
+            packages = load_sync_disk_cache(stamp)
+            if packages is None:
+                packages = _alpm_sync_packages()
+                if packages is None:
+                    packages = _pacman_sync_packages()
+                save_sync_disk_cache(stamp, packages)
+            _SYNC_CACHE = (stamp, packages, frozenset(name for name, _ in packages))
+        return _SYNC_CACHE[1]
+
+def _pacman_sync_packages():
+    """Get (name, repo) for every sync db package by parsing `pacman -Sl`"""
+    names = []
+    repos = []
+    # Stream pacman -Sl line by line as bytes; only the fields we keep get decoded
+    with subprocess.Popen(['pacman', '-Sl'], stdout=subprocess.PIPE, bufsize=1 << 16) as proc:
+        for line in proc.stdout:
+            # "repo name version [installed]"; partition avoids building a list per line
+            repo, _, rest = line.partition(b' ')
+            name = rest.partition(b' ')[0].rstrip(b'\n')
+            if name:
+                names.append(name)
+                repos.append(repo)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+    # Decode all names in one call and each distinct repo name once
+    names = b'\n'.join(names).decode().split('\n') if names else []
+    repo_names = {repo: repo.decode() for repo in set(repos)}
+    return [(name, repo_names[repo]) for name, repo in zip(names, repos, strict=True)]
+
+def _alpm_installed_names():
+    """
+    Get installed package names straight from the local db via pyalpm.
+    Returns None if pyalpm isn't installed or can't read the db, so callers
+    fall back to pacman.
+    """
+    if pyalpm is None:
+        return None
     try:
-        result = subprocess.run(['pacman', '-Q', 'pacman-contrib'],
-                              capture_output=True, text=True)
-        return result.returncode == 0
+        handle = pyalpm.Handle('/', '/var/lib/pacman')
+        return frozenset(pkg.name for pkg in handle.get_localdb().pkgcache)
     except Exception:
-        return False
+        return None
+
+def _alpm_sync_packages():
+    """
+    Get (name, repo) for every sync db package via pyalpm, in pacman.conf repo
+    order like `pacman -Sl`. Returns None if pyalpm isn't installed or fails.
+    """
+    if pyalpm is None:
+        return None
+    try:
+        parsed = parsed_pacman_conf()
+        repo_names = dict.fromkeys(section for section, _, _ in parsed if section and section != 'options')
+        handle = pyalpm.Handle('/', '/var/lib/pacman')
+        packages = []
+        for repo in repo_names:
+            db = handle.register_syncdb(repo, pyalpm.SIG_DATABASE_OPTIONAL)
+            packages.extend((pkg.name, repo) for pkg in db.pkgcache)
+        return packages
+    except Exception:
+        return None
+
+def foreign_package_set():
+    """
+    Get installed packages that aren't in any sync db (AUR and other foreign
+    packages), i.e. what `pacman -Qm` lists, from the two cached lists above.
+    Raises CalledProcessError if pacman fails.
+    """
+    sync_package_list()
+    return installed_package_set() - _SYNC_CACHE[2]
+
+_HAS_PACMAN_CONTRIB = None
+
+def check_pacman_contrib():
+    """
+    Check if pacman-contrib is installed (provides pactree for dependency analysis).
+    Memoized for the app's lifetime: pacman-contrib isn't expected to be removed
+    mid-run, and install_pacman_contrib() resets the memo while it waits.
+    """
+    global _HAS_PACMAN_CONTRIB
+    if _HAS_PACMAN_CONTRIB is None:
+        _HAS_PACMAN_CONTRIB = 'pacman-contrib' in installed_package_set()
+    return _HAS_PACMAN_CONTRIB
+
+def invalidate_pacman_contrib_cache():
+    """Forget the memoized pacman-contrib check"""
+    global _HAS_PACMAN_CONTRIB
+    _HAS_PACMAN_CONTRIB = None
 
 def get_package_deps_count(package_name):
     """
@@ -32,86 +197,108 @@ def get_package_deps_count(package_name):
 
     try:
         # Use pactree to get dependency tree (-u for unique, -d 1 for depth 1 only)
-        result = subprocess.run(['pactree', '-u', package_name],
-                              capture_output=True, text=True, check=True)
-        # Count lines (excluding the package itself)
-        deps = result.stdout.strip().split('\n')
-        return max(0, len(deps) - 1)
-    except subprocess.CalledProcessError:
+        with subprocess.Popen(['pactree', '-u', package_name], stdout=subprocess.PIPE) as proc:
+            # Count lines as they stream in (excluding the package itself)
+            lines = sum(1 for line in proc.stdout if line.strip())
+        if proc.returncode != 0:
+            return -1
+        return max(0, lines - 1)
+    except OSError:
         return -1
 
-def is_in_ignorepkg(package_name):
-    """Check if a package is in IgnorePkg in /etc/pacman.conf"""
-    try:
+_PACMAN_CONF_CACHE = None
+
+def read_pacman_conf():
+    """
+    Get the text of /etc/pacman.conf, re-reading it only when its mtime or size
+    changed since the last call. Raises OSError if the file can't be read.
+    """
+    global _PACMAN_CONF_CACHE
+    st = os.stat('/etc/pacman.conf')
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _PACMAN_CONF_CACHE is None or _PACMAN_CONF_CACHE[0] != stamp:
         with open('/etc/pacman.conf') as f:
-            content = f.read()
+            _PACMAN_CONF_CACHE = (stamp, f.read())
+    return _PACMAN_CONF_CACHE[1]
 
-        # Look for IgnorePkg lines (commented or uncommented)
-        for line in content.split('\n'):
-            stripped = line.strip()
-            if stripped.startswith('#'):
-                continue
-            if stripped.startswith('IgnorePkg'):
-                # Extract packages after = sign
-                if '=' in stripped:
-                    packages = stripped.split('=', 1)[1].strip()
-                    pkg_list = [p.strip() for p in packages.split()]
-                    if package_name in pkg_list:
-                        return True
-        return False
+def parse_pacman_conf(lines):
+    """
+    Tag each line of /etc/pacman.conf with the [section] it belongs to.
+    Returns a list of (section, key, line) tuples where key is the option name
+    of an active 'Key = value' line, or None for headers, comments and blanks.
+    """
+    parsed = []
+    section = None
+    for line in lines:
+        stripped = line.strip()
+        key = None
+        if stripped.startswith('[') and stripped.endswith(']'):
+            section = stripped[1:-1]
+        elif stripped and not stripped.startswith('#'):
+            key = stripped.split('=', 1)[0].strip()
+        parsed.append((section, key, line))
+    return parsed
+
+_PARSED_CONF_CACHE = None
+
+def parsed_pacman_conf():
+    """
+    Get parse_pacman_conf() of the current /etc/pacman.conf. The parse is reused
+    until read_pacman_conf() picks up a change. Raises OSError if the file can't be read.
+    """
+    global _PARSED_CONF_CACHE
+    text = read_pacman_conf()
+    if _PARSED_CONF_CACHE is None or _PARSED_CONF_CACHE[0] is not text:
+        _PARSED_CONF_CACHE = (text, parse_pacman_conf(text.splitlines(keepends=True)))
+    return _PARSED_CONF_CACHE[1]
+
+def _ignorepkg_tokens(line):
+    """Get the package names listed on an IgnorePkg line"""
+    return line.split('=', 1)[1].split() if '=' in line else []
+
+def ignorepkg_set():
+    """Get every package name listed on IgnorePkg lines in [options]"""
+    try:
+        parsed = parsed_pacman_conf()
     except Exception:
-        return False
+        return set()
+    return {
+        name
+        for section, key, line in parsed
+        if section == 'options' and key == 'IgnorePkg'
+        for name in _ignorepkg_tokens(line)
+    }
+
+def is_in_ignorepkg(package_name):
+    """Check if a package is in IgnorePkg in /etc/pacman.conf"""
+    return package_name in ignorepkg_set()
 
 def add_to_ignorepkg(package_name):
     """Add a package to IgnorePkg in /etc/pacman.conf"""
     try:
-        with open('/etc/pacman.conf') as f:
-            lines = f.readlines()
+        parsed = parsed_pacman_conf()
 
         new_lines = []
+        options_header = None
         found_ignorepkg = False
 
-        for line in lines:
-            stripped = line.strip()
-
-            # Skip commented IgnorePkg lines
-            if stripped.startswith('#IgnorePkg'):
-                new_lines.append(line)
-                continue
-
-            # If we find an active IgnorePkg line, append to it
-            if stripped.startswith('IgnorePkg') and '=' in stripped:
+        for section, key, line in parsed:
+            if section == 'options' and options_header is None:
+                # First line tagged [options] is the header itself
+                options_header = len(new_lines)
+            # Append to the first active IgnorePkg line in [options]
+            if section == 'options' and key == 'IgnorePkg' and not found_ignorepkg:
                 found_ignorepkg = True
-                # Check if package already in line
-                if package_name not in stripped:
-                    line = line.rstrip() + f" {package_name}\n"
-                new_lines.append(line)
-            else:
-                new_lines.append(line)
+                if package_name not in _ignorepkg_tokens(line):
+                    line = line.rstrip('\n') + f" {package_name}\n"
+            new_lines.append(line)
 
-        # If no IgnorePkg line found, add one in the [options] section
+        # If no IgnorePkg line found, add one right after the [options] header
         if not found_ignorepkg:
-            new_lines_with_ignorepkg = []
-            in_options = False
-            added = False
-
-            for line in new_lines:
-                stripped = line.strip()
-                if stripped == '[options]':
-                    in_options = True
-                    new_lines_with_ignorepkg.append(line)
-                elif in_options and not added and (stripped.startswith('[') or not stripped or stripped.startswith('#')):
-                    # Add IgnorePkg before the next section or end of [options]
-                    if not stripped.startswith('['):
-                        new_lines_with_ignorepkg.append(f"IgnorePkg = {package_name}\n")
-                        added = True
-                    new_lines_with_ignorepkg.append(line)
-                    if stripped.startswith('['):
-                        in_options = False
-                else:
-                    new_lines_with_ignorepkg.append(line)
-
-            new_lines = new_lines_with_ignorepkg
+            if options_header is None:
+                print("Error adding to IgnorePkg: no [options] section in /etc/pacman.conf")
+                return False
+            new_lines.insert(options_header + 1, f"IgnorePkg = {package_name}\n")
 
         # Write back
         with open('/etc/pacman.conf', 'w') as f:
@@ -125,26 +312,14 @@ def add_to_ignorepkg(package_name):
 def remove_from_ignorepkg(package_name):
     """Remove a package from IgnorePkg in /etc/pacman.conf"""
     try:
-        with open('/etc/pacman.conf') as f:
-            lines = f.readlines()
+        parsed = parsed_pacman_conf()
 
         new_lines = []
 
-        for line in lines:
-            stripped = line.strip()
-
-            # Skip commented lines
-            if stripped.startswith('#'):
-                new_lines.append(line)
-                continue
-
-            # Process IgnorePkg lines
-            if stripped.startswith('IgnorePkg') and '=' in stripped:
-                parts = stripped.split('=', 1)
-                packages = parts[1].strip().split()
-
+        for section, key, line in parsed:
+            if section == 'options' and key == 'IgnorePkg':
                 # Remove the target package
-                packages = [p for p in packages if p != package_name]
+                packages = [p for p in _ignorepkg_tokens(line) if p != package_name]
 
                 # Only keep the line if there are remaining packages
                 if packages:
@@ -173,15 +348,18 @@ def get_packages_with_many_deps(threshold=50):
 
     try:
         # Get list of explicitly installed packages
-        result = subprocess.run(['pacman', '-Qe'],
-                              capture_output=True, text=True, check=True)
-        packages = [line.split()[0] for line in result.stdout.strip().split('\n') if line]
+        with subprocess.Popen(['pacman', '-Qqe'], stdout=subprocess.PIPE, text=True) as proc:
+            packages = [name for name in map(str.strip, proc.stdout) if name]
+        if proc.returncode != 0:
+            return []
 
-        heavy_packages = []
-        for pkg in packages:
-            dep_count = get_package_deps_count(pkg)
-            if dep_count >= threshold:
-                heavy_packages.append((pkg, dep_count))
+        # Each pactree call is fork/exec bound, so run them concurrently; size the
+        # pool from the CPUs we may actually run on (taskset/cgroup limits), not all of them
+        workers = min(32, len(os.sched_getaffinity(0)) * 4)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            dep_counts = pool.map(get_package_deps_count, packages)
+            heavy_packages = [(pkg, dep_count) for pkg, dep_count in zip(packages, dep_counts, strict=True)
+                              if dep_count >= threshold]
 
         # Sort by dependency count (descending)
         heavy_packages.sort(key=lambda x: x[1], reverse=True)
@@ -191,40 +369,196 @@ def get_packages_with_many_deps(threshold=50):
 
 def is_pacman_running():
     """
-    Check for running pacman processes.
+    Check for running pacman processes by reading /proc/<pid>/comm directly
+    (same exact-name match as `pgrep -x pacman`, without the fork).
     Returns True if pacman is running, False otherwise.
     """
     try:
-        # pgrep -f matches the full command line, -x matches exact process name
-        subprocess.check_output(['pgrep', '-x', 'pacman'], text=True)
-        print('Pacman pid found!!')
-        return True
-    except subprocess.CalledProcessError:
-        # pgrep returns non-zero exit code when no processes found
-        print('No pacman pid found')
-        return False
-    except Exception as e:
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{entry.name}/comm') as f:
+                        if f.read().strip() == 'pacman':
+                            print('Pacman pid found!!')
+                            return True
+                except OSError:
+                    # Process exited between listing and reading
+                    continue
+    except OSError as e:
         print(f"Error checking pacman process: {e}")
         return False
+    print('No pacman pid found')
+    return False
+
+_OS_RELEASE = None
+
+def get_os_release():
+    """
+    Parse /etc/os-release once into a dict.
+    Values are unquoted with shlex, so ID="arch" and ID=arch both yield 'arch'.
+    """
+    global _OS_RELEASE
+    if _OS_RELEASE is None:
+        fields = {}
+        try:
+            with open('/etc/os-release') as f:
+                for line in f:
+                    key, sep, value = line.strip().partition('=')
+                    if not sep or key.startswith('#'):
+                        continue
+                    try:
+                        parts = shlex.split(value)
+                    except ValueError:
+                        parts = [value]
+                    fields[key] = parts[0] if parts else ''
+        except OSError:
+            pass
+        _OS_RELEASE = fields
+    return _OS_RELEASE
+
+def get_os_field(field):
+    """Get a single field from /etc/os-release, or '' if missing"""
+    return get_os_release().get(field, '')
 
+@functools.cache
 def detect_distro():
     """
     Detect if running on Arch or Artix Linux.
     Returns 'arch', 'artix', or 'unknown'
     """
+    distro_id = get_os_field('ID')
+    if distro_id in ('arch', 'artix'):
+        return distro_id
+    return 'unknown'
+
+# Active (uncommented) multilib section headers in pacman.conf
+_MULTILIB_RE = re.compile(r'^\[multilib\]', re.MULTILINE)
+_LIB32_RE = re.compile(r'^\[lib32\]', re.MULTILINE)
+
+# One "Key : Value" line; pacman pads keys on the right, flatpak on the left
+_INFO_LINE_RE = re.compile(r'^([ \t]*)([^\s:][^:]*?)[ \t]*:[ \t]*(.*)$')
+
+# grimaur search output: "NUMBER) package-name ... [aur rpc, 14 votes]"
+_AUR_RESULT_RE = re.compile(r'^(\d+)\)\s+(\S+)')
+_AUR_NAME_RE = re.compile(r'^[a-zA-Z0-9._+-]{2,}$')
+_AUR_VOTES_RE = re.compile(r'\[.*?(\d+)\s+votes')
+
+# pacman -Qi "Installed Size  : 12.34 MiB" lines; sizes in plain bytes are skipped
+_INSTALLED_SIZE_RE = re.compile(rb'Installed Size\s*:\s*([\d.]+)\s+([KMG])iB')
+_SIZE_UNITS = {b'K': 1024, b'M': 1024**2, b'G': 1024**3}
+
+def parse_info_fields(info_text):
+    """
+    Split pacman -Si/-Qi, flatpak info and grimaur inspect output into fields.
+    Returns a list of (key, value) tuples; key is None for lines that are not
+    fields (e.g. flatpak's title line). Indented lines that start at or past
+    the previous value's column (pacman's wrapped Optional Deps, Depends On)
+    are joined onto that value instead of being read as new fields.
+    """
+    fields = []
+    value_col = None
+    for line in info_text.expandtabs().splitlines():
+        stripped = line.strip()
+        if not stripped:
+            value_col = None
+            continue
+        indent = len(line) - len(line.lstrip())
+        if fields and value_col is not None and indent >= value_col:
+            key, value = fields[-1]
+            fields[-1] = (key, f"{value}\n{stripped}")
+            continue
+        m = _INFO_LINE_RE.match(line)
+        if m:
+            fields.append((m.group(2), m.group(3).strip()))
+            value_col = m.start(3)
+        else:
+            fields.append((None, stripped))
+            value_col = None
+    return fields
+
+# Per-boot cache for slow lookups; /run is a tmpfs, so it is dropped on reboot
+_RUN_CACHE_PATH = '/run/pactopac.json'
+
+def _boot_id():
     try:
-        with open('/etc/os-release') as f:
-            content = f.read()
-            for line in content.split('\n'):
-                if line.startswith('ID='):
-                    distro_id = line.split('=', 1)[1].strip().strip('"')
-                    if distro_id == 'arch':
-                        return 'arch'
-                    elif distro_id == 'artix':
-                        return 'artix'
-    except (FileNotFoundError, PermissionError, IndexError, OSError):
+        with open('/proc/sys/kernel/random/boot_id') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def load_run_cache():
+    """
+    Load values cached by an earlier run during this boot.
+    Returns {} if there is no cache or it was written under another boot_id.
+    """
+    try:
+        with open(_RUN_CACHE_PATH) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('boot_id') != _boot_id():
+        return {}
+    return data
+
+def save_run_cache(**values):
+    """Merge values into the per-boot cache, ignoring write failures"""
+    data = load_run_cache()
+    data.update(values, boot_id=_boot_id())
+    try:
+        with open(_RUN_CACHE_PATH, 'w') as f:
+            json.dump(data, f)
+    except OSError:
         pass
-    return 'unknown'
+
+# A system cache dir rather than the invoking user's: the app runs as root, and
+# the sync dbs it describes are system-wide too
+_SYNC_DISK_CACHE_PATH = '/var/cache/pactopac/sync.json'
+
+def load_sync_disk_cache(stamp):
+    """
+    Load the (name, repo) list saved by an earlier run for the same sync db stamp.
+    Returns None if there is no cache, it can't be read, or the dbs changed since.
+    """
+    if stamp is None:
+        return None
+    try:
+        with open(_SYNC_DISK_CACHE_PATH) as f:
+            data = json.load(f)
+        # JSON turns the stamp's tuples into lists
+        if data['stamp'] != [list(entry) for entry in stamp]:
+            return None
+        return [(name, repo) for repo, names in data['repos'] for name in names]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def save_sync_disk_cache(stamp, packages):
+    """Save the sync list for the next run, grouped by repo; write failures are ignored"""
+    if stamp is None:
+        return
+    # -Sl order is repo by repo, so grouping runs of the same repo keeps it
+    repos = []
+    for name, repo in packages:
+        if not repos or repos[-1][0] != repo:
+            repos.append((repo, []))
+        repos[-1][1].append(name)
+    try:
+        os.makedirs(os.path.dirname(_SYNC_DISK_CACHE_PATH), exist_ok=True)
+        tmp_path = _SYNC_DISK_CACHE_PATH + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'stamp': stamp, 'repos': repos}, f, separators=(',', ':'))
+        os.replace(tmp_path, _SYNC_DISK_CACHE_PATH)
+    except OSError:
+        pass
+
+class PkgItem(GObject.Object):
+    """List model item wrapping a package tuple for the package ListViews"""
+    __gtype_name__ = 'PkgItem'
+
+    def __init__(self, pkg_data):
+        super().__init__()
+        self.pkg_data = pkg_data
 
 class PkgMan(Adw.ApplicationWindow):
     def __init__(self, app):
@@ -248,12 +582,18 @@ class PkgMan(Adw.ApplicationWindow):
             sys.exit(1)
 
         self.sudo_user: str = sudo_user  # Type annotation: always a string
+        self.config_dir = f"/home/{sudo_user}/.config/pactopac"  # Per-user settings files
 
         self.packages = []
+        self.names_lower = []  # Lowercased package names, parallel to self.packages
+        self.packages_by_type = collections.defaultdict(list)  # type -> [(package, name_lower)]
+        self.package_counts = collections.Counter()  # (type, installed) -> count
         self.filtered_packages = []
+        self._pkg_items = {}  # PkgItem per package tuple, reused across searches
+        self._filter_cache = collections.OrderedDict()  # (tab, installed_only, query, threshold) -> filtered packages, LRU order
+        self._tab_candidates = {}  # (tab, installed_only) -> (package, name_lower) pairs searched
+        self._shown_results = {}  # tab -> filtered list currently spliced into its store
         self.selected = None
-        self.page_size = 100
-        self.current_page = 0
         self.current_tab = "installed"  # Default to installed tab
         self.running_processes = []  # Track running pacman/flatpak processes
         self.installed_aur = set()  # Track installed AUR packages
@@ -261,10 +601,24 @@ class PkgMan(Adw.ApplicationWindow):
         self.aur_votes_cache = {}  # Cache AUR package votes from search
         self.aur_total_count = None  # Cache total AUR package count
         self.aur_count_loading = False  # Flag to prevent duplicate count requests
+        self._grimaur_available = None  # Cached result of check_grimaur()
+        self._flatpak_available = None  # Cached result of check_fp()
+        self._flathub_enabled = None  # Cached result of check_fh()
+        self._search_source_id = 0  # Pending debounced search timeout
+        self._size_cache = None  # (local db stamp, formatted total) for get_total_package_sizes
+        self._config_cache = {}  # ~/.config/pactopac file name -> contents (see _read_config)
+        # Shared workers for short background jobs (loads, lookups, toggles);
+        # network-bound AUR jobs use daemon threads instead. A load takes four
+        # workers at once, the rest keep lookups and toggles responsive meanwhile
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=6, thread_name_prefix='pactopac')
+        self.connect("destroy", lambda w: self._pool.shutdown(wait=False, cancel_futures=True))
         self.fuzzy_threshold = self.get_fuzzy_threshold()  # Fuzzy match threshold
         self.terminal_font_size = self.get_terminal_font_size()  # VTE terminal font size
-        self.setup_ui()
+        # Start the pacman/flatpak queries on the worker pool first so they run while
+        # the widgets are built; their results reach update_list through the main
+        # loop, which only dispatches once setup_ui has finished
         self.load_packages()
+        self.setup_ui()
     
 
     def monitor_processes_and_close(self, window):
@@ -298,6 +652,8 @@ class PkgMan(Adw.ApplicationWindow):
         toolbar_view.set_content(box)
         
         self.search = Gtk.SearchEntry(placeholder_text="Search packages...")
+        # on_search_changed does its own debouncing; don't stack GTK's 150ms delay on top
+        self.search.set_search_delay(0)
         self.search.connect("search-changed", self.on_search_changed)
 
         # Add escape key handler to refocus list
@@ -307,198 +663,20 @@ class PkgMan(Adw.ApplicationWindow):
 
         box.append(self.search)
 
-        # Add view stack for Installed/Available tabs
+        # Add view stack with one tab per package view
         self.view_stack = Adw.ViewStack()
+        self.tabs = {}  # tab name -> (ListView, Gtk.Stack switching it with the empty state)
+        for name, title, icon in (
+            ("installed", "Installed", "object-select-symbolic"),
+            ("flatpak", "Flatpak", "application-x-addon-symbolic"),
+            ("aur", "AUR", "software-properties-symbolic"),
+            ("available", "Available", "folder-download-symbolic"),
+            ("all", "All", "view-list-symbolic"),
+        ):
+            list_view, stack = self.create_package_tab(name)
+            self.tabs[name] = (list_view, stack)
+            self.view_stack.add_titled_with_icon(stack, name, title, icon)
 
-        # Create Installed tab
-        installed_page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        self.installed_scroll = Gtk.ScrolledWindow(vexpand=True)
-        self.installed_scroll.add_css_class("card")
-        
-        # Container for list and load more button
-        installed_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        self.installed_list = Gtk.ListBox()
-        self.installed_list.add_css_class("boxed-list")
-        self.installed_list.connect("row-selected", self.on_select)
-
-        # Enable keyboard navigation
-        self.installed_list.set_can_focus(True)
-        self.installed_list.set_selection_mode(Gtk.SelectionMode.BROWSE)
-
-        # Add keyboard event controller for arrow keys
-        key_controller = Gtk.EventControllerKey()
-        key_controller.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
-        key_controller.connect("key-pressed", self.on_list_key_pressed, self.installed_list)
-        self.installed_list.add_controller(key_controller)
-
-        installed_container.append(self.installed_list)
-
-        # Load More button with consistent styling
-        self.installed_load_more = Gtk.Button(label="Load More", sensitive=False)
-        self.installed_load_more.connect("clicked", self.load_more_packages)
-        self.installed_load_more.set_margin_top(6)
-        self.installed_load_more.set_margin_bottom(6)
-        self.installed_load_more.set_margin_start(6)
-        self.installed_load_more.set_margin_end(6)
-        installed_container.append(self.installed_load_more)
-        
-        self.installed_scroll.set_child(installed_container)
-        installed_page.append(self.installed_scroll)
-        
-        self.view_stack.add_titled_with_icon(installed_page, "installed", "Installed", "object-select-symbolic")
-        
-        # Create Flatpak tab
-        flatpak_page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        self.flatpak_scroll = Gtk.ScrolledWindow(vexpand=True)
-        self.flatpak_scroll.add_css_class("card")
-
-        # Container for list and load more button
-        flatpak_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        self.flatpak_list = Gtk.ListBox()
-        self.flatpak_list.add_css_class("boxed-list")
-        self.flatpak_list.connect("row-selected", self.on_select)
-
-        # Enable keyboard navigation but skip in tab order
-        self.flatpak_list.set_can_focus(True)
-        self.flatpak_list.set_focus_on_click(False)
-        self.flatpak_list.set_selection_mode(Gtk.SelectionMode.BROWSE)
-
-        # Add keyboard event controller for arrow keys
-        key_controller = Gtk.EventControllerKey()
-        key_controller.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
-        key_controller.connect("key-pressed", self.on_list_key_pressed, self.flatpak_list)
-        self.flatpak_list.add_controller(key_controller)
-
-        flatpak_container.append(self.flatpak_list)
-
-        # Load More button with consistent styling
-        self.flatpak_load_more = Gtk.Button(label="Load More", sensitive=False)
-        self.flatpak_load_more.connect("clicked", self.load_more_packages)
-        self.flatpak_load_more.set_margin_top(6)
-        self.flatpak_load_more.set_margin_bottom(6)
-        self.flatpak_load_more.set_margin_start(6)
-        self.flatpak_load_more.set_margin_end(6)
-        flatpak_container.append(self.flatpak_load_more)
-
-        self.flatpak_scroll.set_child(flatpak_container)
-        flatpak_page.append(self.flatpak_scroll)
-
-        self.view_stack.add_titled_with_icon(flatpak_page, "flatpak", "Flatpak", "application-x-addon-symbolic")
-
-        # Create AUR tab
-        aur_page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        self.aur_scroll = Gtk.ScrolledWindow(vexpand=True)
-        self.aur_scroll.add_css_class("card")
-
-        # Container for list and load more button
-        aur_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        self.aur_list = Gtk.ListBox()
-        self.aur_list.add_css_class("boxed-list")
-        self.aur_list.connect("row-selected", self.on_select)
-
-        # Enable keyboard navigation but skip in tab order
-        self.aur_list.set_can_focus(True)
-        self.aur_list.set_focus_on_click(False)
-        self.aur_list.set_selection_mode(Gtk.SelectionMode.BROWSE)
-
-        # Add keyboard event controller for arrow keys
-        key_controller = Gtk.EventControllerKey()
-        key_controller.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
-        key_controller.connect("key-pressed", self.on_list_key_pressed, self.aur_list)
-        self.aur_list.add_controller(key_controller)
-
-        aur_container.append(self.aur_list)
-
-        # Load More button with consistent styling
-        self.aur_load_more = Gtk.Button(label="Load More", sensitive=False)
-        self.aur_load_more.connect("clicked", self.load_more_packages)
-        self.aur_load_more.set_margin_top(6)
-        self.aur_load_more.set_margin_bottom(6)
-        self.aur_load_more.set_margin_start(6)
-        self.aur_load_more.set_margin_end(6)
-        aur_container.append(self.aur_load_more)
-
-        self.aur_scroll.set_child(aur_container)
-        aur_page.append(self.aur_scroll)
-
-        self.view_stack.add_titled_with_icon(aur_page, "aur", "AUR", "software-properties-symbolic")
-        
-        # Create Available tab
-        available_page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        self.available_scroll = Gtk.ScrolledWindow(vexpand=True)
-        self.available_scroll.add_css_class("card")
-        
-        # Container for list and load more button
-        available_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        self.available_list = Gtk.ListBox()
-        self.available_list.add_css_class("boxed-list")
-        self.available_list.connect("row-selected", self.on_select)
-
-        # Enable keyboard navigation but skip in tab order
-        self.available_list.set_can_focus(True)
-        self.available_list.set_focus_on_click(False)
-        self.available_list.set_selection_mode(Gtk.SelectionMode.BROWSE)
-
-        # Add keyboard event controller for arrow keys
-        key_controller = Gtk.EventControllerKey()
-        key_controller.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
-        key_controller.connect("key-pressed", self.on_list_key_pressed, self.available_list)
-        self.available_list.add_controller(key_controller)
-
-        available_container.append(self.available_list)
-        
-        # Load More button with consistent styling
-        self.available_load_more = Gtk.Button(label="Load More", sensitive=False)
-        self.available_load_more.connect("clicked", self.load_more_packages)
-        self.available_load_more.set_margin_top(6)
-        self.available_load_more.set_margin_bottom(6)
-        self.available_load_more.set_margin_start(6)
-        self.available_load_more.set_margin_end(6)
-        available_container.append(self.available_load_more)
-        
-        self.available_scroll.set_child(available_container)
-        available_page.append(self.available_scroll)
-        
-        self.view_stack.add_titled_with_icon(available_page, "available", "Available", "folder-download-symbolic")
-        
-        # Create All tab
-        all_page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        self.all_scroll = Gtk.ScrolledWindow(vexpand=True)
-        self.all_scroll.add_css_class("card")
-        
-        # Container for list and load more button
-        all_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        self.all_list = Gtk.ListBox()
-        self.all_list.add_css_class("boxed-list")
-        self.all_list.connect("row-selected", self.on_select)
-
-        # Enable keyboard navigation but skip in tab order
-        self.all_list.set_can_focus(True)
-        self.all_list.set_focus_on_click(False)
-        self.all_list.set_selection_mode(Gtk.SelectionMode.BROWSE)
-
-        # Add keyboard event controller for arrow keys
-        key_controller = Gtk.EventControllerKey()
-        key_controller.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
-        key_controller.connect("key-pressed", self.on_list_key_pressed, self.all_list)
-        self.all_list.add_controller(key_controller)
-
-        all_container.append(self.all_list)
-        
-        # Load More button with consistent styling
-        self.all_load_more = Gtk.Button(label="Load More", sensitive=False)
-        self.all_load_more.connect("clicked", self.load_more_packages)
-        self.all_load_more.set_margin_top(6)
-        self.all_load_more.set_margin_bottom(6)
-        self.all_load_more.set_margin_start(6)
-        self.all_load_more.set_margin_end(6)
-        all_container.append(self.all_load_more)
-        
-        self.all_scroll.set_child(all_container)
-        all_page.append(self.all_scroll)
-        
-        self.view_stack.add_titled_with_icon(all_page, "all", "All", "view-list-symbolic")
-        
         # Set default to installed
         self.view_stack.set_visible_child_name("installed")
         
@@ -600,12 +778,50 @@ class PkgMan(Adw.ApplicationWindow):
         else:
             style_manager.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
     
+    def create_package_tab(self, name):
+        """Build a tab's package ListView and the stack that swaps it for the empty state"""
+        stack = Gtk.Stack(vexpand=True)
+        scroll = Gtk.ScrolledWindow(vexpand=True)
+        scroll.add_css_class("card")
+
+        # ListView must be the direct scroll child so only visible rows are realized
+        list_view = self.create_package_list()
+        if name != "installed":
+            # Enable keyboard navigation but skip in tab order
+            list_view.set_focus_on_click(False)
+        scroll.set_child(list_view)
+        stack.add_named(scroll, "list")
+        return list_view, stack
+
+    def create_package_list(self):
+        """
+        Create a ListView over a Gio.ListStore of PkgItem.
+        Row widgets are built once per visible slot and recycled on scroll/refresh.
+        """
+        store = Gio.ListStore.new(PkgItem)
+        selection = Gtk.SingleSelection(model=store)
+        selection.connect("notify::selected-item", self.on_select)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self.on_package_row_setup)
+        factory.connect("bind", self.on_package_row_bind)
+
+        list_view = Gtk.ListView(model=selection, factory=factory, show_separators=True)
+        list_view.set_can_focus(True)
+
+        # Add keyboard event controller for arrow keys
+        key_controller = Gtk.EventControllerKey()
+        key_controller.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+        key_controller.connect("key-pressed", self.on_list_key_pressed, list_view)
+        list_view.add_controller(key_controller)
+
+        return list_view
+
     def on_stack_changed(self, view_stack, param):
         """Handle view stack change to update current filter"""
         visible_child_name = view_stack.get_visible_child_name()
         if visible_child_name:
             self.current_tab = visible_child_name
-            self.current_page = 0
             self.refresh_list()
 
     def change_filter(self, filter_name, popover):
@@ -626,7 +842,6 @@ class PkgMan(Adw.ApplicationWindow):
 
     def on_installed_toggle(self, toggle):
         """Handle installed only toggle change"""
-        self.current_page = 0
         self.refresh_list()
 
     def show_settings(self, button):
@@ -862,9 +1077,8 @@ class PkgMan(Adw.ApplicationWindow):
         appearance_group = Adw.PreferencesGroup(title="Appearance", description="Customize look and feel")
         about_page.add(appearance_group)
         
-        # Get current theme state
-        style_manager = Adw.StyleManager.get_default()
-        is_light = style_manager.get_color_scheme() == Adw.ColorScheme.FORCE_LIGHT
+        # Current theme state, from the saved preference (kept in step by on_theme_toggle)
+        is_light = self.load_theme_pref()
         
         theme_row = Adw.SwitchRow(
             title="Theme Preference",
@@ -918,27 +1132,33 @@ class PkgMan(Adw.ApplicationWindow):
             self.show_error("Flatpak is not installed")
 
     def handle_clean_orphans(self, button):
-        def check_and_clean():
-            try:
-                # Check if there are orphaned packages
-                result = subprocess.run(['pacman', '-Qtdq'], capture_output=True, text=True)
-                orphaned_packages = result.stdout.strip()
-                
-                if orphaned_packages:
-                    # Remove orphaned packages
-                    cmd = ['pacman', '-Rns'] + orphaned_packages.split('\n')
-                    if self.get_noconfirm_enabled():
-                        cmd.append('--noconfirm')
-                    GLib.idle_add(lambda: self.run_cmd(cmd))
-                else:
-                    # No orphans found, clean cache instead
-                    GLib.idle_add(lambda: self.show_cache_clean_dialog())
-                
-            except subprocess.CalledProcessError:
-                # No orphans found, clean cache instead
-                GLib.idle_add(lambda: self.show_cache_clean_dialog())
-        
-        threading.Thread(target=check_and_clean, daemon=True).start()
+        # GIO runs the query and calls back on the main loop, so the result can go
+        # straight to run_cmd or the cache dialog without a worker thread
+        try:
+            proc = Gio.Subprocess.new(['pacman', '-Qtdq'],
+                                      Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_SILENCE)
+        except GLib.Error:
+            self.show_cache_clean_dialog()
+            return
+        proc.communicate_utf8_async(None, None, self.on_orphans_listed)
+
+    def on_orphans_listed(self, proc, result):
+        try:
+            _, orphaned_packages, _ = proc.communicate_utf8_finish(result)
+        except GLib.Error:
+            orphaned_packages = None
+
+        # pacman -Qtdq exits non-zero with no output when there are no orphans
+        orphaned_packages = (orphaned_packages or '').split()
+        if orphaned_packages:
+            # Remove orphaned packages
+            cmd = ['pacman', '-Rns'] + orphaned_packages
+            if self.get_noconfirm_enabled():
+                cmd.append('--noconfirm')
+            self.run_cmd(cmd)
+        else:
+            # No orphans found, clean cache instead
+            self.show_cache_clean_dialog()
 
     def show_cache_clean_dialog(self):
         dialog = Adw.AlertDialog(
@@ -966,203 +1186,166 @@ class PkgMan(Adw.ApplicationWindow):
             self.run_cmd(cmd)
 
     def check_fp(self):
-        try:
-            cmd = (['sudo', '-u', self.sudo_user, 'flatpak', '--version'])
-            subprocess.run(cmd, capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, OSError):
-            return False
+        """Check if flatpak is usable (probed once until invalidate_flatpak_checks())"""
+        if self._flatpak_available is None:
+            self._flatpak_available = self._probe_fp()
+        return self._flatpak_available
 
-    def check_grimaur(self):
-        """Check if grimaur is available"""
-        try:
-            grimaur_path = os.path.join(os.path.dirname(__file__), 'grimaur-too/grimaur.py')
-            if os.path.exists(grimaur_path):
+    def invalidate_flatpak_checks(self):
+        """Forget the cached flatpak/flathub checks after something may have changed them"""
+        self._flatpak_available = None
+        self._flathub_enabled = None
 
-                result = subprocess.run(['sudo', '-u', self.sudo_user, 'python3', grimaur_path, '--help'], capture_output=True, timeout=5)
+    def _probe_fp(self):
+        # flatpak is a system package (/usr/bin), so a PATH lookup is enough to
+        # tell whether it's installed without exec'ing it
+        return shutil.which('flatpak') is not None
 
-                return result.returncode == 0
-        except (subprocess.SubprocessError, FileNotFoundError, OSError, TimeoutError):
-            pass
-        return False
+    def check_grimaur(self):
+        """Check if grimaur is available (probed once, the script doesn't move at runtime)"""
+        if self._grimaur_available is None:
+            self._grimaur_available = self._probe_grimaur()
+        return self._grimaur_available
+
+    def _probe_grimaur(self):
+        # The script ships with the app, so checking it and the interpreter exist
+        # is enough; no need to fork sudo + python3 just to run --help
+        return os.path.isfile(_GRIMAUR_PATH) and shutil.which('python3') is not None
+
+    def _read_config(self, name):
+        """Read a ~/.config/pactopac setting; files are read once, None if missing"""
+        if name not in self._config_cache:
+            try:
+                with open(os.path.join(self.config_dir, name)) as f:
+                    self._config_cache[name] = f.read().strip()
+            except OSError:
+                self._config_cache[name] = None
+        return self._config_cache[name]
+
+    def _write_config(self, name, value):
+        """Save a ~/.config/pactopac setting and keep the cached copy in step"""
+        # Re-selecting the current value needn't touch the disk
+        if self._read_config(name) == value.strip():
+            return
+        os.makedirs(self.config_dir, exist_ok=True)
+        path = os.path.join(self.config_dir, name)
+        # Write aside and rename so a crash can't leave a truncated setting
+        with open(path + '.tmp', 'w') as f:
+            f.write(value)
+            # We run as root: keep an existing file's owner and mode, as the
+            # old in-place write did, instead of leaving a root-owned replacement
+            try:
+                st = os.stat(path)
+                os.fchown(f.fileno(), st.st_uid, st.st_gid)
+                os.fchmod(f.fileno(), st.st_mode & 0o7777)
+            except FileNotFoundError:
+                pass
+        os.replace(path + '.tmp', path)
+        self._config_cache[name] = value.strip()
 
     def get_grimaur_enabled(self):
         """Check if AUR support is enabled in config"""
-        try:
-            config_file = f"/home/{self.sudo_user}/.config/pactopac/aur_enabled"
-            with open(config_file) as f:
-                return f.read().strip() == "1"
-        except (FileNotFoundError, PermissionError, OSError):
-            return False  # Default to disabled
+        return self._read_config("aur_enabled") == "1"  # Default to disabled
 
     def set_grimaur_enabled(self, enabled):
         """Save AUR enable state to config"""
-        config_dir = f"/home/{self.sudo_user}/.config/pactopac"
-        os.makedirs(config_dir, exist_ok=True)
-        config_file = os.path.join(config_dir, "aur_enabled")
-        with open(config_file, 'w') as f:
-            f.write("1" if enabled else "0")
+        self._write_config("aur_enabled", "1" if enabled else "0")
 
     def get_git_mirror_enabled(self):
         """Check if git mirror is enabled in config"""
-        try:
-            config_file = f"/home/{self.sudo_user}/.config/pactopac/git_mirror_enabled"
-            with open(config_file) as f:
-                return f.read().strip() == "1"
-        except (FileNotFoundError, PermissionError, OSError):
-            return False
+        return self._read_config("git_mirror_enabled") == "1"
 
     def set_git_mirror_enabled(self, enabled):
         """Save git mirror enable state to config"""
-        config_dir = f"/home/{self.sudo_user}/.config/pactopac"
-        os.makedirs(config_dir, exist_ok=True)
-        config_file = os.path.join(config_dir, "git_mirror_enabled")
-        with open(config_file, 'w') as f:
-            f.write("1" if enabled else "0")
+        self._write_config("git_mirror_enabled", "1" if enabled else "0")
 
     def get_remove_cache_enabled(self):
         """Check if remove cache is enabled in config"""
-        try:
-            config_file = f"/home/{self.sudo_user}/.config/pactopac/remove_cache_enabled"
-            with open(config_file) as f:
-                return f.read().strip() == "1"
-        except (FileNotFoundError, PermissionError, OSError):
-            return False
+        return self._read_config("remove_cache_enabled") == "1"
 
     def set_remove_cache_enabled(self, enabled):
         """Save remove cache enable state to config"""
-        config_dir = f"/home/{self.sudo_user}/.config/pactopac"
-        os.makedirs(config_dir, exist_ok=True)
-        config_file = os.path.join(config_dir, "remove_cache_enabled")
-        with open(config_file, 'w') as f:
-            f.write("1" if enabled else "0")
+        self._write_config("remove_cache_enabled", "1" if enabled else "0")
 
     def get_clean_after_install_enabled(self):
         """Check if clean after install is enabled in config"""
-        try:
-            config_file = f"/home/{self.sudo_user}/.config/pactopac/clean_after_install"
-            with open(config_file) as f:
-                return f.read().strip() == "1"
-        except (FileNotFoundError, PermissionError, OSError):
-            return False
+        return self._read_config("clean_after_install") == "1"
 
     def set_clean_after_install_enabled(self, enabled):
         """Save clean after install state to config"""
-        config_dir = f"/home/{self.sudo_user}/.config/pactopac"
-        os.makedirs(config_dir, exist_ok=True)
-        config_file = os.path.join(config_dir, "clean_after_install")
-        with open(config_file, 'w') as f:
-            f.write("1" if enabled else "0")
+        self._write_config("clean_after_install", "1" if enabled else "0")
 
     def get_fetch_only_enabled(self):
         """Check if fetch only mode is enabled in config"""
-        try:
-            config_file = f"/home/{self.sudo_user}/.config/pactopac/fetch_only"
-            with open(config_file) as f:
-                return f.read().strip() == "1"
-        except (FileNotFoundError, PermissionError, OSError):
-            return False
+        return self._read_config("fetch_only") == "1"
 
     def set_fetch_only_enabled(self, enabled):
         """Save fetch only state to config"""
-        config_dir = f"/home/{self.sudo_user}/.config/pactopac"
-        os.makedirs(config_dir, exist_ok=True)
-        config_file = os.path.join(config_dir, "fetch_only")
-        with open(config_file, 'w') as f:
-            f.write("1" if enabled else "0")
+        self._write_config("fetch_only", "1" if enabled else "0")
 
     def get_aur_dest_root(self):
         """Get the custom dest-root path for AUR builds"""
-        try:
-            config_file = f"/home/{self.sudo_user}/.config/pactopac/aur_dest_root"
-            with open(config_file) as f:
-                return f.read().strip()
-        except (FileNotFoundError, PermissionError, OSError):
-            return ""
+        return self._read_config("aur_dest_root") or ""
 
     def set_aur_dest_root(self, path):
         """Save AUR dest-root path to config"""
-        config_dir = f"/home/{self.sudo_user}/.config/pactopac"
-        os.makedirs(config_dir, exist_ok=True)
-        config_file = os.path.join(config_dir, "aur_dest_root")
-        with open(config_file, 'w') as f:
-            f.write(path)
+        self._write_config("aur_dest_root", path)
 
     def get_noconfirm_enabled(self):
         """Check if noconfirm is enabled in config"""
-        try:
-            config_file = f"/home/{self.sudo_user}/.config/pactopac/noconfirm_enabled"
-            with open(config_file) as f:
-                return f.read().strip() == "1"
-        except (FileNotFoundError, PermissionError, OSError):
-            return False  # Default to disabled (ask for confirmation)
+        return self._read_config("noconfirm_enabled") == "1"  # Default to disabled (ask for confirmation)
 
     def set_noconfirm_enabled(self, enabled):
         """Save noconfirm enable state to config"""
-        config_dir = f"/home/{self.sudo_user}/.config/pactopac"
-        os.makedirs(config_dir, exist_ok=True)
-        config_file = os.path.join(config_dir, "noconfirm_enabled")
-        with open(config_file, 'w') as f:
-            f.write("1" if enabled else "0")
+        self._write_config("noconfirm_enabled", "1" if enabled else "0")
 
     def get_fuzzy_threshold(self):
         """Get fuzzy match threshold from config"""
         try:
-            config_file = f"/home/{self.sudo_user}/.config/pactopac/fuzzy_threshold"
-            with open(config_file) as f:
-                return float(f.read().strip())
-        except (FileNotFoundError, PermissionError, OSError, ValueError):
+            return float(self._read_config("fuzzy_threshold"))
+        except (TypeError, ValueError):
             return 0.4  # Default to 40%
 
     def set_fuzzy_threshold(self, threshold):
         """Save fuzzy match threshold to config"""
-        config_dir = f"/home/{self.sudo_user}/.config/pactopac"
-        os.makedirs(config_dir, exist_ok=True)
-        config_file = os.path.join(config_dir, "fuzzy_threshold")
-        with open(config_file, 'w') as f:
-            f.write(str(threshold))
+        self._write_config("fuzzy_threshold", str(threshold))
 
     def get_terminal_font_size(self):
         """Get terminal font size from config"""
         try:
-            config_file = f"/home/{self.sudo_user}/.config/pactopac/terminal_font_size"
-            with open(config_file) as f:
-                return int(f.read().strip())
-        except (FileNotFoundError, PermissionError, OSError, ValueError):
+            return int(self._read_config("terminal_font_size"))
+        except (TypeError, ValueError):
             return 12  # Default to 12pt
 
     def set_terminal_font_size(self, size):
         """Save terminal font size to config"""
-        config_dir = f"/home/{self.sudo_user}/.config/pactopac"
-        os.makedirs(config_dir, exist_ok=True)
-        config_file = os.path.join(config_dir, "terminal_font_size")
-        with open(config_file, 'w') as f:
-            f.write(str(int(size)))
+        self._write_config("terminal_font_size", str(int(size)))
 
     def check_fh(self):
-        try:
-            result = subprocess.run(['sudo', '-u', self.sudo_user, 'flatpak', 'remotes'], capture_output=True, text=True, check=True)
+        """Check if the flathub remote is enabled (probed once until invalidate_flatpak_checks())"""
+        if self._flathub_enabled is None:
+            self._flathub_enabled = self._probe_fh()
+        return self._flathub_enabled
 
-            for line in result.stdout.split('\n'):
-                if 'flathub' in line.lower():
-                    return 'disabled' not in line.lower()
-            return False
+    def _probe_fh(self):
+        try:
+            with subprocess.Popen(['sudo', '-u', self.sudo_user, 'flatpak', 'remotes'], stdout=subprocess.PIPE, text=True) as proc:
+                enabled = None
+                for line in proc.stdout:
+                    line = line.lower()
+                    if enabled is None and 'flathub' in line:
+                        enabled = 'disabled' not in line
+            return proc.returncode == 0 and bool(enabled)
         except (subprocess.CalledProcessError, FileNotFoundError, OSError):
             return False
     
     def check_multilib_enabled(self):
         """Check if multilib is enabled (works for both Arch and Artix)"""
         try:
-            with open('/etc/pacman.conf') as f:
-                content = f.read()
-                distro = detect_distro()
-
-                if distro == 'artix':
-                    # Artix uses [lib32]
-                    return bool(re.search(r'^\[lib32\]', content, re.MULTILINE))
-                else:
-                    # Arch uses [multilib]
-                    return bool(re.search(r'^\[multilib\]', content, re.MULTILINE))
+            content = read_pacman_conf()
+            # Artix uses [lib32], Arch uses [multilib]
+            pattern = _LIB32_RE if detect_distro() == 'artix' else _MULTILIB_RE
+            return bool(pattern.search(content))
         except (FileNotFoundError, PermissionError, OSError):
             return False
 
@@ -1187,25 +1370,14 @@ class PkgMan(Adw.ApplicationWindow):
         dialog.present(self)
 
     def save_theme_pref(self, is_light_theme):
-        config_dir = f"/home/{self.sudo_user}/.config/pactopac"
-        os.makedirs(config_dir, exist_ok=True)
-
-        config_file = os.path.join(config_dir, "theme")
-        with open(config_file, 'w') as f:
-            f.write("1" if is_light_theme else "0")
+        self._write_config("theme", "1" if is_light_theme else "0")
 
     def load_theme_pref(self):
-        try:
-            config_file = f"/home/{self.sudo_user}/.config/pactopac/theme"
-            with open(config_file) as f:
-                return f.read().strip() == "1"
-        except (FileNotFoundError, PermissionError, OSError):
-            return False  # Default to dark theme
+        return self._read_config("theme") == "1"  # Default to dark theme
 
     def is_first_run(self):
         """Check if this is the first run by checking if theme config exists"""
-        config_file = f"/home/{self.sudo_user}/.config/pactopac/theme"
-        return not os.path.exists(config_file)
+        return self._read_config("theme") is None
 
     def on_theme_toggle(self, switch_row, param):
         style_manager = Adw.StyleManager.get_default()
@@ -1223,15 +1395,20 @@ class PkgMan(Adw.ApplicationWindow):
         dialog.add_response("ok", "OK")
         dialog.present(self)
     
-    def run_toggle(self, enabled, enable_cmd, disable_cmd):
-        # threaded utilities to not block UI
+    def run_toggle(self, enabled, enable_cmd, disable_cmd, followup_cmd=None):
+        # threaded utilities to not block UI; followup_cmd runs after the toggle
+        # command succeeds, its failure isn't fatal to the toggle
         def run():
             try:
                 subprocess.run(enable_cmd if enabled else disable_cmd, check=True)
+                if followup_cmd:
+                    subprocess.run(followup_cmd, check=False)
+                # The command may have added or enabled a flatpak remote
+                self.invalidate_flatpak_checks()
                 GLib.idle_add(self.load_packages)
             except subprocess.CalledProcessError as e:
                 print(f"Toggle error: {e}")
-        threading.Thread(target=run, daemon=True).start()
+        self._pool.submit(run)
     
     def on_multilib_toggle(self, switch_row, param):
         enabled = switch_row.get_active()
@@ -1239,8 +1416,9 @@ class PkgMan(Adw.ApplicationWindow):
 
         if enabled:
             # Enable the multilib/lib32 repo by uncommenting
-            self.run_toggle(True, ['sed', '-i', f'/^#\\[{repo_name}\\]/{{s/^#//;n;s/^#//}}', '/etc/pacman.conf'], None)
-            subprocess.run(['pacman', '-Sy'], check=True)
+            # then sync it; both run on the worker so the UI doesn't wait on the mirror
+            self.run_toggle(True, ['sed', '-i', f'/^#\\[{repo_name}\\]/{{s/^#//;n;s/^#//}}', '/etc/pacman.conf'], None,
+                            ['pacman', '-Sy'])
         else:
             # Disable the multilib/lib32 repo by commenting out
             self.run_toggle(False, None, ['sed', '-i', f'/^\\[{repo_name}\\]/{{s/^/#/;n;s/^/#/}}', '/etc/pacman.conf'])
@@ -1248,13 +1426,14 @@ class PkgMan(Adw.ApplicationWindow):
     def on_fh_toggle(self, switch_row, param):
         enabled = switch_row.get_active()
         if enabled:
-            # Always try to add first (handles both missing and disabled cases)
-            self.run_toggle(True, ['sudo', '-u', self.sudo_user, 'flatpak', 'remote-add', '--if-not-exists', 'flathub', 'https://dl.flathub.org/repo/flathub.flatpakrepo'], None)
-            # Then make sure it's enabled
-            subprocess.run(['sudo', '-u', self.sudo_user, 'flatpak', 'remote-modify', '--enable', 'flathub'], check=False)
+            # Always try to add first (handles both missing and disabled cases),
+            # then make sure it's enabled
+            self.run_toggle(True, ['sudo', '-u', self.sudo_user, 'flatpak', 'remote-add', '--if-not-exists', 'flathub', 'https://dl.flathub.org/repo/flathub.flatpakrepo'], None,
+                            ['sudo', '-u', self.sudo_user, 'flatpak', 'remote-modify', '--enable', 'flathub'])
         else:
             self.show_error("SUDO_USER not found")
 
+        self.invalidate_flatpak_checks()
         GLib.idle_add(self.load_packages)
 
     def on_aur_toggle(self, switch_row, param):
@@ -1302,13 +1481,18 @@ class PkgMan(Adw.ApplicationWindow):
         if self.aur_count_loading:
             return None
 
+        # The AUR total moves slowly, so reuse what an earlier run fetched this boot
+        cached = load_run_cache().get('aur_total_count')
+        if isinstance(cached, int):
+            self.aur_total_count = cached
+            return cached
+
         self.aur_count_loading = True
 
         def fetch_count():
             try:
-                grimaur_path = os.path.join(os.path.dirname(__file__), 'grimaur-too/grimaur.py')
                 result = subprocess.run(
-                    ['sudo', '-u', self.sudo_user, 'python3', grimaur_path, 'count'],
+                    ['sudo', '-u', self.sudo_user, 'python3', _GRIMAUR_PATH, 'count'],
                     capture_output=True,
                     text=True,
                     timeout=10
@@ -1316,24 +1500,26 @@ class PkgMan(Adw.ApplicationWindow):
                 if result.returncode == 0:
                     count = int(result.stdout.strip())
                     self.aur_total_count = count
+                    save_run_cache(aur_total_count=count)
                     GLib.idle_add(self.refresh_list)
             except (subprocess.SubprocessError, ValueError, OSError):
                 pass
             finally:
                 self.aur_count_loading = False
 
+        # A network call (up to its timeout), so like the dependency scan it gets a
+        # daemon thread: it can't starve the pool's workers or hold up exit
         threading.Thread(target=fetch_count, daemon=True).start()
         return None
 
     def check_pacman_styling_enabled(self):
         """Check if pacman styling (Color and ILoveCandy) is enabled"""
         try:
-            with open('/etc/pacman.conf') as f:
-                content = f.read()
-                # Check for uncommented Color and ILoveCandy
-                has_color = 'Color\n' in content and '#Color' not in content
-                has_candy = 'ILoveCandy' in content
-                return has_color and has_candy
+            content = read_pacman_conf()
+            # Check for uncommented Color and ILoveCandy
+            has_color = 'Color\n' in content and '#Color' not in content
+            has_candy = 'ILoveCandy' in content
+            return has_color and has_candy
         except (FileNotFoundError, PermissionError, OSError):
             return False
     
@@ -1361,23 +1547,24 @@ class PkgMan(Adw.ApplicationWindow):
 
     def enable_pacman_styling(self):
         """Enable pacman styling using the existing script"""
-        script_path = os.path.join(os.path.dirname(__file__), 'lib/stylepac.py')
-        if os.path.exists(script_path):
+        if os.path.exists(_STYLEPAC_PATH):
             try:
-                subprocess.run(['python3', script_path], check=True)
-            except subprocess.CalledProcessError:
-                self.show_error("Failed to enable pacman styling")
+                # Run in-process rather than forking a second interpreter; runpy is
+                # only needed for this one-off toggle, so it isn't imported at startup
+                import runpy
+                runpy.run_path(_STYLEPAC_PATH, run_name='__main__')
+            except Exception as e:
+                self.show_error(f"Failed to enable pacman styling: {e}")
         else:
             self.show_error("Stylepac script (stylepac.py) not found")
     
     def disable_pacman_styling(self):
         """Disable pacman styling by reverting changes"""
         try:
-            with open('/etc/pacman.conf') as f:
-                lines = f.readlines()
-            
+            original = read_pacman_conf()
+
             new_lines = []
-            for line in lines:
+            for line in original.splitlines(keepends=True):
                 stripped = line.strip()
                 # Comment out Color
                 if stripped == "Color":
@@ -1387,177 +1574,157 @@ class PkgMan(Adw.ApplicationWindow):
                     continue
                 else:
                     new_lines.append(line)
-            
-            with open('/etc/pacman.conf', 'w') as f:
-                f.writelines(new_lines)
-                
+
+            # Leave the file (and its mtime, which keys the pacman.conf caches) alone
+            # when styling was already off
+            text = ''.join(new_lines)
+            if text != original:
+                with open('/etc/pacman.conf', 'w') as f:
+                    f.write(text)
+
         except Exception as e:
             self.show_error(f"Failed to disable pacman styling: {e}")
     
-    def update_package_status(self):
-        """Update package installation status without reloading the entire list"""
+    def update_package_status(self, sources=("pacman", "flatpak", "aur")):
+        """
+        Update package installation status without reloading the entire list.
+        Only the backends named in sources are re-queried; packages of other
+        types keep their current installed flag.
+        """
         def update():
             try:
                 # Get current installed packages
-                result = subprocess.run(['pacman', '-Q'], capture_output=True, text=True, check=True)
-                installed_pacman = {line.split()[0] for line in result.stdout.strip().split('\n') if line}
+                installed_pacman = set()
+                if "pacman" in sources:
+                    invalidate_installed_cache()
+                    installed_pacman = installed_package_set()
 
                 # Get installed flatpak packages
                 installed_flatpak = set()
-                try:
-                    result = subprocess.run(['flatpak', 'list', '--app', '--columns=application'],
-                                          capture_output=True, text=True, check=True)
-                    for line in result.stdout.strip().split('\n'):
-                        if line and not line.startswith('Application'):
-                            installed_flatpak.add(line.strip())
-                except Exception:
-                    pass
+                if "flatpak" in sources:
+                    try:
+                        with subprocess.Popen(['flatpak', 'list', '--app', '--columns=application'],
+                                              stdout=subprocess.PIPE, text=True) as proc:
+                            app_ids = map(str.strip, proc.stdout)
+                            installed_flatpak = {app_id for app_id in app_ids
+                                                 if app_id and not app_id.startswith('Application')}
+                    except Exception:
+                        pass
 
                 # Get installed AUR packages
-                self.refresh_installed_aur()
+                if "aur" in sources:
+                    self.refresh_installed_aur()
 
                 # Update package list with new installed status
                 updated_packages = []
                 for pkg in self.packages:
                     pkg_name = pkg[0]
                     pkg_repo = pkg[1]
-                    pkg_type = pkg[3] if len(pkg) > 3 else "pacman"
-                    
+                    pkg_type = pkg[3]
+
+                    # Keep packages from backends that weren't re-queried
+                    if pkg_type not in sources:
+                        updated_packages.append(pkg)
+                        continue
+
                     # Determine new installed status
                     if pkg_type == "aur":
                         is_installed = pkg_name in self.installed_aur
                     elif pkg_type == "flatpak":
                         # For flatpaks, check using the application ID (index 4), not the display name
-                        pkg_app_id = pkg[4] if len(pkg) > 4 else None
-                        is_installed = pkg_app_id in installed_flatpak if pkg_app_id else False
+                        is_installed = pkg[4] in installed_flatpak
                     else:  # pacman
                         is_installed = pkg_name in installed_pacman
 
-                    # Create updated package tuple
-                    if len(pkg) > 4:
-                        updated_pkg = (pkg_name, pkg_repo, is_installed, pkg_type, pkg[4])
-                    else:
-                        updated_pkg = (pkg_name, pkg_repo, is_installed, pkg_type)
-                    updated_packages.append(updated_pkg)
+                    updated_packages.append((pkg_name, pkg_repo, is_installed, pkg_type, pkg[4]))
 
                 # Update packages list and refresh display
-                self.packages = updated_packages
-                GLib.idle_add(self.refresh_list)
+                GLib.idle_add(self.update_list, updated_packages)
 
             except Exception as e:
                 print(f"Error updating package status: {e}")
                 # Fall back to full reload on error
                 GLib.idle_add(self.load_packages)
 
-        threading.Thread(target=update, daemon=True).start()
+        self._pool.submit(update)
         return False
 
     def load_packages(self):
-        def load():
-            try:
-                packages = []
-
-                # Load pacman packages
-                all_pkgs = subprocess.run(['pacman', '-Sl'], capture_output=True, text=True, check=True)
-                installed = {line.split()[0] for line in subprocess.run(['pacman', '-Q'], capture_output=True, text=True).stdout.split('\n') if line}
-
-                for line in all_pkgs.stdout.split('\n'):
-                    if line:
-                        parts = line.split(' ', 2)
-                        if len(parts) >= 2:
-                            packages.append((parts[1], parts[0], parts[1] in installed, "pacman"))
-
-                # Load flatpak packages
-                if self.check_fp() and self.check_fh():
-                    try:
-                        available = subprocess.run(['sudo', '-u', self.sudo_user, 'flatpak', 'remote-ls', '--app', 'flathub'], capture_output=True, text=True, check=True)
-                        installed_fps = subprocess.run(['sudo', '-u', self.sudo_user, 'flatpak', 'list', '--app'], capture_output=True, text=True, check=True)
-
-                        installed_ids = {line.split('\t')[1] for line in installed_fps.stdout.split('\n') if line.strip() and len(line.split('\t')) > 1}
-
-                        for line in available.stdout.split('\n'):
-                            if line.strip():
-                                parts = line.split('\t')
-                                if len(parts) >= 3:
-                                    packages.append((parts[0], "flathub", parts[1] in installed_ids, "flatpak", parts[1]))
-                    except subprocess.CalledProcessError:
-                        pass
-
-                # Load AUR packages
-                if self.check_grimaur() and self.get_grimaur_enabled():
-                    try:
-                        grimaur_path = os.path.join(os.path.dirname(__file__), 'grimaur-too/grimaur.py')
-                        # Get installed AUR packages (foreign packages)
-
-                        result = subprocess.run(['sudo', '-u', self.sudo_user, 'python3', grimaur_path, 'list'], capture_output=True, text=True, timeout=30)
-
-                        installed_aur = set()
-                        if result.returncode == 0:
-                            for line in result.stdout.strip().split('\n'):
-                                # Strip leading whitespace and color codes
-                                line = line.strip()
-
-                                # Skip empty lines
-                                if not line:
-                                    continue
-
-                                # Skip header line (starts with "Installed foreign packages" or ends with colon)
-                                if line.lower().startswith('installed') or line.endswith(':'):
-                                    continue
-
-                                # Parse "package-name version" format
-                                parts = line.split()
-                                if len(parts) >= 1:  # Changed from >= 2 to handle packages without versions
-                                    pkg_name = parts[0]
-
-                                    # Validate package name format (alphanumeric, hyphens, underscores, dots, plus)
-                                    import re
-                                    if re.match(r'^[a-zA-Z0-9._+-]+$', pkg_name):
-                                        installed_aur.add(pkg_name)
-                                        packages.append((pkg_name, "aur", True, "aur"))
-
-                        # Store installed AUR packages for search functionality
-                        self.installed_aur = installed_aur
-                    except Exception as e:
-                        print(f"Error loading AUR packages: {e}")
-                        self.installed_aur = set()
+        def load_pacman(sync_future):
+            # -Qq runs here while -Sl runs on its own worker, so on a cold cache
+            # the two pacman processes overlap
+            installed = installed_package_set()
+            return [(name, repo, name in installed, "pacman", None) for name, repo in sync_future.result()]
+
+        def load_flatpak():
+            packages = []
+            if self.check_fp() and self.check_fh():
+                try:
+                    # Start both queries before waiting on either so they overlap;
+                    # explicit --columns keeps the tab-separated layout stable across versions
+                    user_cmd = ['sudo', '-u', self.sudo_user, 'flatpak']
+                    with subprocess.Popen(user_cmd + ['remote-ls', '--app', '--columns=name,application', 'flathub'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as available, \
+                         subprocess.Popen(user_cmd + ['list', '--app', '--columns=application'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as installed_fps:
+                        installed_ids = {line.strip() for line in installed_fps.stdout}
+                        rows = (line.rstrip('\n').partition('\t') for line in available.stdout)
+                        packages = [(name, "flathub", app_id in installed_ids, "flatpak", app_id)
+                                    for name, sep, app_id in rows if sep and app_id]
+
+                    if available.returncode != 0 or installed_fps.returncode != 0:
+                        packages = []
+                except OSError:
+                    pass
+            return packages
 
+        def load_aur():
+            packages = []
+            if self.check_grimaur() and self.get_grimaur_enabled():
+                try:
+                    # Installed AUR packages are the foreign ones (`grimaur list` is
+                    # `pacman -Qm`), derived here from the cached pacman lists
+                    installed_aur = foreign_package_set()
+                    packages = [(pkg_name, "aur", True, "aur", None) for pkg_name in sorted(installed_aur)]
+
+                    # Store installed AUR packages for search functionality
+                    self.installed_aur = set(installed_aur)
+                except Exception as e:
+                    print(f"Error loading AUR packages: {e}")
+                    self.installed_aur = set()
+            return packages
+
+        # The backends don't depend on each other, so query them in parallel on the
+        # shared pool and concatenate in a fixed order. sync_package_list is queued
+        # first, so load_pacman never waits on a job that hasn't started
+        sync_future = self._pool.submit(sync_package_list)
+        futures = [self._pool.submit(load_pacman, sync_future),
+                   self._pool.submit(load_flatpak),
+                   self._pool.submit(load_aur)]
+        pending = len(futures)
+        pending_lock = threading.Lock()
+
+        def on_loader_done(_future):
+            # Joined here rather than in a waiting job: the last loader to finish
+            # hands the combined list to the main loop
+            nonlocal pending
+            with pending_lock:
+                pending -= 1
+                if pending:
+                    return
+            try:
+                packages = [pkg for future in futures for pkg in future.result()]
                 GLib.idle_add(self.update_list, packages)
             except Exception as e:
-                GLib.idle_add(self.status.set_text, f"Error: {e}")
+                # Look self.status up on the main loop: the load starts before setup_ui builds it
+                message = f"Error: {e}"
+                GLib.idle_add(lambda: self.status.set_text(message))
 
-        threading.Thread(target=load, daemon=True).start()
+        for future in futures:
+            future.add_done_callback(on_loader_done)
 
     def refresh_installed_aur(self):
-        """Refresh the list of installed AUR packages by calling grimaur list"""
+        """Refresh the set of installed AUR (foreign) packages"""
         try:
-            grimaur_path = os.path.join(os.path.dirname(__file__), 'grimaur-too/grimaur.py')
-            result = subprocess.run(['sudo', '-u', self.sudo_user, 'python3', grimaur_path, 'list'],
-                                    capture_output=True, text=True, timeout=10)
-
-            installed_aur = set()
-            if result.returncode == 0:
-                import re
-                for line in result.stdout.strip().split('\n'):
-                    line = line.strip()
-
-                    # Skip empty lines
-                    if not line:
-                        continue
-
-                    # Skip header lines (e.g., "Installed foreign packages (1):")
-                    if line.lower().startswith('installed') or line.endswith(':'):
-                        continue
-
-                    # Parse "package-name version" format
-                    parts = line.split()
-                    if len(parts) >= 1:  # Changed from >= 2 to >= 1 to handle packages without versions
-                        pkg_name = parts[0]
-                        # Validate package name format
-                        if re.match(r'^[a-zA-Z0-9._+-]+$', pkg_name):
-                            installed_aur.add(pkg_name)
-
-            self.installed_aur = installed_aur
+            self.installed_aur = set(foreign_package_set())
         except Exception as e:
             print(f"Error refreshing installed AUR list: {e}")
 
@@ -1574,22 +1741,19 @@ class PkgMan(Adw.ApplicationWindow):
             cached_results = self.aur_search_cache[search_term]
             # Update installed status for cached results
             updated_results = []
-            for pkg_name, repo, _, pkg_type in cached_results:
+            for pkg_name, repo, _, pkg_type, app_id in cached_results:
                 is_installed = pkg_name in self.installed_aur
-                updated_results.append((pkg_name, repo, is_installed, pkg_type))
+                updated_results.append((pkg_name, repo, is_installed, pkg_type, app_id))
             self.aur_search_cache[search_term] = updated_results
             return updated_results
         
         try:
-            grimaur_path = os.path.join(os.path.dirname(__file__), 'grimaur-too/grimaur.py')
-            cmd = ['sudo', '-u', self.sudo_user, 'python3', grimaur_path, 'search', '--no-interactive', '--no-color', search_term]
+            cmd = ['sudo', '-u', self.sudo_user, 'python3', _GRIMAUR_PATH, 'search', '--no-interactive', '--no-color', search_term]
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
             
             aur_packages = []
             if result.returncode == 0 and result.stdout.strip():
-                import re
-                
-                for line in result.stdout.split('\n'):
+                for line in result.stdout.splitlines():
                     # Skip "No matches found" or similar messages
                     if line.strip().lower().startswith('no '):
                         continue
@@ -1615,7 +1779,7 @@ class PkgMan(Adw.ApplicationWindow):
                         continue
 
                     # Match lines with numbering format: "NUMBER) package-name"
-                    match = re.match(r'^(\d+)\)\s+(\S+)', line)
+                    match = _AUR_RESULT_RE.match(line)
                     if not match:
                         continue
 
@@ -1623,17 +1787,17 @@ class PkgMan(Adw.ApplicationWindow):
                     pkg_name = match.group(2)
 
                     # Validate package name format
-                    if not re.match(r'^[a-zA-Z0-9._+-]{2,}$', pkg_name):
+                    if not _AUR_NAME_RE.match(pkg_name):
                         continue
 
                     # Extract votes from line like "[aur rpc, 14 votes]"
-                    votes_match = re.search(r'\[.*?(\d+)\s+votes', line)
+                    votes_match = _AUR_VOTES_RE.search(line)
                     if votes_match:
                         self.aur_votes_cache[pkg_name] = int(votes_match.group(1))
 
                     # Check if it's installed
                     is_installed = pkg_name in self.installed_aur
-                    aur_packages.append((pkg_name, "aur", is_installed, "aur"))
+                    aur_packages.append((pkg_name, "aur", is_installed, "aur", None))
             
             # match how grimoir works
             aur_packages.reverse()
@@ -1645,15 +1809,70 @@ class PkgMan(Adw.ApplicationWindow):
             print(f"Error searching AUR: {e}")
             return []
 
-    def update_list(self, packages):
+    def set_packages(self, packages):
+        """Replace the package list and rebuild the lowercased names used by search"""
         self.packages = packages
-        self.current_page = 0
+        self.names_lower = [p[0].lower() for p in packages]
+        self._filter_cache.clear()
+        # Per-backend (package, lowercased name) pairs so a tab only scans its own packages
+        self.packages_by_type = collections.defaultdict(list)
+        for p, name_lower in zip(packages, self.names_lower, strict=True):
+            self.packages_by_type[p[3]].append((p, name_lower))
+        # (type, installed) -> count, for the status bar
+        self.package_counts = collections.Counter((p[3], bool(p[2])) for p in packages)
+        self._tab_candidates = {}
+        # Keep list items for packages that survived the reload unchanged
+        old_items = self._pkg_items
+        self._pkg_items = {p: old_items[p] for p in packages if p in old_items}
+
+    def get_tab_candidates(self, tab, installed_only):
+        """
+        Get the (package, lowercased name) pairs a tab searches, with the
+        installed-only filter already applied. Built once per package list.
+        """
+        key = (tab, installed_only)
+        candidates = self._tab_candidates.get(key)
+        if candidates is None:
+            if tab == "installed":
+                # Show pacman/system packages
+                pairs = self.packages_by_type.get("pacman", ())
+            elif tab in ("flatpak", "aur"):
+                pairs = self.packages_by_type.get(tab, ())
+            else:  # all tab
+                pairs = zip(self.packages, self.names_lower, strict=True)
+            if installed_only:
+                candidates = [pair for pair in pairs if pair[0][2]]
+            else:
+                candidates = list(pairs)
+            self._tab_candidates[key] = candidates
+        return candidates
+
+    def get_pkg_item(self, pkg_data):
+        """Get the list model item for a package, creating it on first display"""
+        item = self._pkg_items.get(pkg_data)
+        if item is None:
+            item = self._pkg_items[pkg_data] = PkgItem(pkg_data)
+        return item
+
+    def update_list(self, packages):
+        self.set_packages(packages)
         self.refresh_list()
         return False
     
     def on_search_changed(self, search_entry):
-        self.current_page = 0
-        search_text = search_entry.get_text().strip()
+        # Coalesce bursts of keystrokes so only the last query is filtered
+        if self._search_source_id:
+            GLib.source_remove(self._search_source_id)
+            self._search_source_id = 0
+        if not search_entry.get_text().strip():
+            # Clearing the search restores the full list right away
+            self.do_search()
+            return
+        self._search_source_id = GLib.timeout_add(120, self.do_search)
+
+    def do_search(self):
+        self._search_source_id = 0
+        search_text = self.search.get_text().strip()
 
         # When searching, automatically switch to All tab and uncheck installed filter
         if search_text:
@@ -1669,25 +1888,30 @@ class PkgMan(Adw.ApplicationWindow):
                     # Remove old AUR search results first
                     GLib.idle_add(self.merge_aur_search_results, aur_results)
 
+                # grimaur hits the network (30s timeout): a daemon thread keeps slow
+                # searches from occupying pool workers or blocking exit
                 threading.Thread(target=search_and_update, daemon=True).start()
         else:
             # Clear search cache when search is cleared
             self.aur_search_cache.clear()
 
         self.refresh_list()
+        return GLib.SOURCE_REMOVE
 
     def merge_aur_search_results(self, aur_results):
         """Merge AUR search results into the main package list"""
         # Remove existing AUR packages that are not installed
-        self.packages = [p for p in self.packages if not (len(p) > 3 and p[3] == "aur" and not p[2])]
+        packages = [p for p in self.packages if not (p[3] == "aur" and not p[2])]
 
         # Create a set of existing package names to avoid duplicates
-        existing_names = {p[0] for p in self.packages}
+        existing_names = {p[0] for p in packages}
 
         # Add new AUR search results only if not already in the list
         for aur_pkg in aur_results:
             if aur_pkg[0] not in existing_names:
-                self.packages.append(aur_pkg)
+                packages.append(aur_pkg)
+
+        self.set_packages(packages)
 
         # Refresh the display
         self.refresh_list()
@@ -1700,170 +1924,144 @@ class PkgMan(Adw.ApplicationWindow):
         if keyval == Gdk.KEY_Down:
             current_list = self.get_current_list()
             if current_list:
-                selected_row = current_list.get_selected_row()
-                if not selected_row:
-                    # Select first row if nothing selected
-                    first_row = current_list.get_row_at_index(0)
-                    if first_row:
-                        current_list.select_row(first_row)
-                        selected_row = first_row
-
-                if selected_row:
-                    current_list.grab_focus()
+                selection = current_list.get_model()
+                if selection.get_n_items() > 0:
+                    position = selection.get_selected()
+                    if position == Gtk.INVALID_LIST_POSITION:
+                        # Select first row if nothing selected
+                        position = 0
+                    current_list.scroll_to(position, Gtk.ListScrollFlags.FOCUS | Gtk.ListScrollFlags.SELECT, None)
                     return True
 
         return False
 
     def get_current_list(self):
-        """Get the ListBox for the current tab"""
-        if self.current_tab == "installed":
-            return self.installed_list
-        elif self.current_tab == "available":
-            return self.available_list
-        elif self.current_tab == "flatpak":
-            return self.flatpak_list
-        elif self.current_tab == "aur":
-            return self.aur_list
-        else:  # all tab
-            return self.all_list
+        """Get the ListView for the current tab"""
+        return self.tabs[self.current_tab][0]
     
-    def fuzzy_match(self, search_text, package_name):
-        """Check if search_text fuzzy matches package_name"""
-        if not search_text:
-            return True, 1.0
-
-        search_lower = search_text.lower()
-        name_lower = package_name.lower()
-
-        # Exact substring match gets priority
-        if search_lower in name_lower:
-            return True, 1.0
-
-        # Fuzzy match using SequenceMatcher
-        similarity = SequenceMatcher(None, search_lower, name_lower).ratio()
+    def fuzzy_filter(self, search_lower, candidates):
+        """
+        Get the packages from (package, name_lower) candidates that match
+        search_lower (already lowercased), best matches first.
+        """
+        # Substring matches get priority, prefix matches above the rest so
+        # typing "fire" lists firefox before libfirestarter
+        prefix_matches = []
+        substring_matches = []
+        fuzzy_matches = []
+
+        # As in difflib.get_close_matches, the query is seq2: SequenceMatcher indexes
+        # seq2 once, and set_seq1() per name only swaps the side that isn't indexed.
+        # real_quick_ratio() and quick_ratio() are cheap upper bounds on ratio(),
+        # so most names are rejected without the full longest-match search
+        threshold = self.fuzzy_threshold
+        matcher = SequenceMatcher(None, b=search_lower)
+        for p, name_lower in candidates:
+            if search_lower in name_lower:
+                if name_lower.startswith(search_lower):
+                    prefix_matches.append(p)
+                else:
+                    substring_matches.append(p)
+                continue
+            matcher.set_seq1(name_lower)
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            similarity = matcher.ratio()
+            # Match if similarity is above user-configured threshold
+            if similarity >= threshold:
+                fuzzy_matches.append((p, similarity))
 
-        # Match if similarity is above user-configured threshold
-        return similarity >= self.fuzzy_threshold, similarity
+        # Only an identical name scores 1.0, and that is a substring match, so the
+        # fuzzy matches all rank below the substring ones
+        fuzzy_matches.sort(key=lambda x: x[1], reverse=True)
+        return prefix_matches + substring_matches + [p for p, similarity in fuzzy_matches]
 
     def refresh_list(self):
-        # Determine which list and button to use based on current tab
-        if self.current_tab == "installed":
-            current_list = self.installed_list
-            load_more_btn = self.installed_load_more
-        elif self.current_tab == "available":
-            current_list = self.available_list
-            load_more_btn = self.available_load_more
-        elif self.current_tab == "flatpak":
-            current_list = self.flatpak_list
-            load_more_btn = self.flatpak_load_more
-        elif self.current_tab == "aur":
-            current_list = self.aur_list
-            load_more_btn = self.aur_load_more
-        else:  # all tab
-            current_list = self.all_list
-            load_more_btn = self.all_load_more
+        current_list, current_stack = self.tabs[self.current_tab]
 
-        # Clear the current list if starting from page 0
-        if self.current_page == 0:
-            while child := current_list.get_first_child():
-                current_list.remove(child)
+        selection = current_list.get_model()
+        store = selection.get_model()
 
         search_text = self.search.get_text()
+        search_lower = search_text.lower()
         installed_only = self.installed_only_toggle.get_active()
 
-        # Filter packages based on search and tab with fuzzy matching
-        matches_with_scores = []
+        # Backspacing or flipping tabs revisits recent queries; reuse their results.
+        # Narrowing from the previous query's matches isn't safe here: a longer
+        # query can raise a name's fuzzy ratio above the threshold.
+        cache_key = (self.current_tab, installed_only, search_lower, self.fuzzy_threshold)
+        filtered = self._filter_cache.get(cache_key)
+        if filtered is not None:
+            self._filter_cache.move_to_end(cache_key)
+        else:
+            # Filter packages based on search and tab with fuzzy matching
+            candidates = self.get_tab_candidates(self.current_tab, installed_only)
 
-        if self.current_tab == "installed":
-            # Show pacman/system packages
-            for p in self.packages:
-                if len(p) > 3 and p[3] == "pacman":
-                    if installed_only and not p[2]:
-                        continue
-                    matches, score = self.fuzzy_match(search_text, p[0])
-                    if matches:
-                        matches_with_scores.append((p, score))
-        elif self.current_tab == "flatpak":
-            # Show flatpak packages
-            for p in self.packages:
-                if len(p) > 3 and p[3] == "flatpak":
-                    if installed_only and not p[2]:
-                        continue
-                    matches, score = self.fuzzy_match(search_text, p[0])
-                    if matches:
-                        matches_with_scores.append((p, score))
-        elif self.current_tab == "aur":
-            # Show AUR packages
-            for p in self.packages:
-                if len(p) > 3 and p[3] == "aur":
-                    if installed_only and not p[2]:
-                        continue
-                    matches, score = self.fuzzy_match(search_text, p[0])
-                    if matches:
-                        matches_with_scores.append((p, score))
-        else:  # all tab
-            # Show all packages
-            for p in self.packages:
-                if installed_only and not p[2]:
-                    continue
-                matches, score = self.fuzzy_match(search_text, p[0])
-                if matches:
-                    matches_with_scores.append((p, score))
+            if not search_lower:
+                # Nothing to score: the tab's packages in their original order
+                if self.current_tab in ("available", "all") and not installed_only:
+                    filtered = self.packages
+                else:
+                    filtered = [p for p, name_lower in candidates]
+            else:
+                filtered = self.fuzzy_filter(search_lower, candidates)
+
+            self._filter_cache[cache_key] = filtered
+            if len(self._filter_cache) > 32:
+                self._filter_cache.popitem(last=False)
+        self.filtered_packages = filtered
 
-        # Sort by score (highest first) to show best matches at the top
-        matches_with_scores.sort(key=lambda x: x[1], reverse=True)
-        self.filtered_packages = [p for p, score in matches_with_scores]
-        
         total_filtered = len(self.filtered_packages)
-        start_idx = self.current_page * self.page_size
-        end_idx = min((self.current_page + 1) * self.page_size, total_filtered)
-        
-        packages_to_show = self.filtered_packages[start_idx:end_idx] if self.current_page > 0 else self.filtered_packages[0:end_idx]
-        
-        # Add packages to the appropriate list
-        for pkg_data in packages_to_show:
-            self.add_package_row(pkg_data, current_list)
-        
+
+        # Swap the model contents in one splice; the ListView rebinds its
+        # existing row widgets and the items themselves are reused, so a
+        # keystroke allocates no new GObjects once the results have been seen.
+        # All matches go into the model: only rows in the viewport are realized,
+        # so there is no need to page results behind a Load More button.
+        # A result list already in this tab's store (a query revisited through
+        # the filter cache) needs no splice at all
+        if self._shown_results.get(self.current_tab) is not self.filtered_packages:
+            new_items = [self.get_pkg_item(pkg_data) for pkg_data in self.filtered_packages]
+            store.splice(0, store.get_n_items(), new_items)
+            self._shown_results[self.current_tab] = self.filtered_packages
+
         # Handle empty states
         if total_filtered == 0:
-            self.add_empty_state_message(current_list)
-        
-        # Update UI
-        has_more = end_idx < total_filtered
-        load_more_btn.set_sensitive(has_more)
-        load_more_btn.set_label("More..." if has_more else "All packages loaded")
+            self.add_empty_state_message(current_stack)
+        else:
+            current_stack.set_visible_child_name("list")
 
-        total_showing = min((self.current_page + 1) * self.page_size, total_filtered)
+        # Update UI
         if search_text:
-            self.status.set_text(f"Showing {total_showing} of {total_filtered} filtered packages")
+            self.status.set_text(f"Showing {total_filtered} filtered packages")
         else:
-            total_installed_pacman = sum(1 for pkg in self.packages if pkg[2] and len(pkg) > 3 and pkg[3] == "pacman")
-            total_installed_flatpak = sum(1 for pkg in self.packages if pkg[2] and len(pkg) > 3 and pkg[3] == "flatpak")
-            total_installed_aur = sum(1 for pkg in self.packages if pkg[2] and len(pkg) > 3 and pkg[3] == "aur")
+            total_installed_pacman = self.package_counts["pacman", True]
+            total_installed_flatpak = self.package_counts["flatpak", True]
+            total_installed_aur = self.package_counts["aur", True]
             total_installed = total_installed_pacman + total_installed_flatpak + total_installed_aur
 
             if self.current_tab == "installed":
                 # Get total size for pacman packages only
                 total_size = self.get_total_package_sizes()
-                self.status.set_text(f"Showing {total_showing} of {total_filtered} • {total_installed_pacman} pacman installed • {total_size}")
+                self.status.set_text(f"Showing {total_filtered} • {total_installed_pacman} pacman installed • {total_size}")
             elif self.current_tab == "flatpak":
-                self.status.set_text(f"Showing {total_showing} of {total_filtered} • {total_installed_flatpak} flatpak installed")
+                self.status.set_text(f"Showing {total_filtered} • {total_installed_flatpak} flatpak installed")
             elif self.current_tab == "aur":
                 # Get total AUR count
                 aur_count = self.get_aur_count()
                 if search_text:
                     # When searching, show search result count
-                    total_aur_available = sum(1 for pkg in self.packages if not pkg[2] and len(pkg) > 3 and pkg[3] == "aur")
-                    self.status.set_text(f"Showing {total_showing} of {total_filtered} • {total_installed_aur} installed, {total_aur_available} in results")
+                    total_aur_available = self.package_counts["aur", False]
+                    self.status.set_text(f"Showing {total_filtered} • {total_installed_aur} installed, {total_aur_available} in results")
                 else:
                     # When not searching, show total AUR size
                     if aur_count is not None:
-                        self.status.set_text(f"Showing {total_showing} of {total_filtered} • {total_installed_aur} installed, {aur_count:,} available in AUR")
+                        self.status.set_text(f"Showing {total_filtered} • {total_installed_aur} installed, {aur_count:,} available in AUR")
                     else:
-                        self.status.set_text(f"Showing {total_showing} of {total_filtered} • {total_installed_aur} installed, loading count...")
+                        self.status.set_text(f"Showing {total_filtered} • {total_installed_aur} installed, loading count...")
             elif self.current_tab == "available":
                 total_available = len(self.packages) - total_installed
-                self.status.set_text(f"Showing {total_showing} of {total_filtered} • {total_available} available packages")
+                self.status.set_text(f"Showing {total_filtered} • {total_available} available packages")
             else:  # all tab
                 total_available = len(self.packages) - total_installed
                 # Add AUR total count if enabled
@@ -1872,68 +2070,78 @@ class PkgMan(Adw.ApplicationWindow):
                     if aur_count is not None:
                         # Add AUR total minus already counted installed AUR packages
                         total_available = total_available + aur_count - total_installed_aur
-                        self.status.set_text(f"Showing {total_showing} of {total_filtered} • {total_installed} installed, {total_available:,} available")
+                        self.status.set_text(f"Showing {total_filtered} • {total_installed} installed, {total_available:,} available")
                     else:
-                        self.status.set_text(f"Showing {total_showing} of {total_filtered} • {total_installed} installed, {total_available:,}+ available (loading AUR count...)")
+                        self.status.set_text(f"Showing {total_filtered} • {total_installed} installed, {total_available:,}+ available (loading AUR count...)")
                 else:
-                    self.status.set_text(f"Showing {total_showing} of {total_filtered} • {total_installed} installed, {total_available} available")
+                    self.status.set_text(f"Showing {total_filtered} • {total_installed} installed, {total_available} available")
 
         # Auto-select first package (but don't auto-focus to allow mouse scrolling)
-        if self.current_page == 0 and total_filtered > 0:
-            first_row = current_list.get_row_at_index(0)
-            if first_row:
-                current_list.select_row(first_row)
+        if total_filtered > 0:
+            selection.set_selected(0)
+        # set_selected() is silent when the row was already selected (e.g. an unspliced
+        # store on a revisited tab), so resync self.selected and the buttons directly
+        self.on_select(selection, None)
     
-    def add_package_row(self, pkg_data, target_list):
-        """Add a package row to the specified list"""
-        name, repo, installed, pkg_type = pkg_data[:4]
-
-        row = Gtk.ListBoxRow()
+    def on_package_row_setup(self, factory, list_item):
+        """Build the row widgets once; bind only updates them"""
         box = Gtk.Box(spacing=12)
         box.set_margin_top(6)
         box.set_margin_bottom(6)
         box.set_margin_start(12)
         box.set_margin_end(12)
 
-        icon = Gtk.Label(label="●" if installed else "○", width_request=20)
-        if installed:
-            icon.add_css_class("success")
-        box.append(icon)
+        box.icon = Gtk.Label(width_request=20)
+        box.append(box.icon)
+
+        box.name_label = Gtk.Label(halign=Gtk.Align.START, hexpand=True)
+        box.append(box.name_label)
+
+        box.repo_label = Gtk.Label()
+        box.repo_label.add_css_class("dim-label")
+        box.append(box.repo_label)
+
+        # (installed, type) the row's style classes currently reflect
+        box.style_key = (False, "pacman")
+
+        list_item.set_child(box)
+
+    def on_package_row_bind(self, factory, list_item):
+        """Fill a (possibly recycled) row with the bound package"""
+        box = list_item.get_child()
+        name, repo, installed, pkg_type, _ = list_item.get_item().pkg_data
 
-        name_label = Gtk.Label(label=name, halign=Gtk.Align.START, hexpand=True)
-        box.append(name_label)
+        box.icon.set_label("●" if installed else "○")
+        box.name_label.set_label(name)
+        box.repo_label.set_label(repo)
 
-        repo_label = Gtk.Label(label=repo)
-        repo_label.add_css_class("dim-label")
+        # Recycled rows mostly get a package of the same kind back; only touch
+        # the style classes (and restyle the labels) when that actually changes
+        style_key = (installed, pkg_type)
+        if style_key == box.style_key:
+            return
+        box.style_key = style_key
+        if installed:
+            box.icon.add_css_class("success")
+        else:
+            box.icon.remove_css_class("success")
         if pkg_type == "flatpak":
-            repo_label.add_css_class("accent")
-        elif pkg_type == "aur":
-            repo_label.add_css_class("warning")
-        box.append(repo_label)
+            box.repo_label.add_css_class("accent")
+        else:
+            box.repo_label.remove_css_class("accent")
+        if pkg_type == "aur":
+            box.repo_label.add_css_class("warning")
+        else:
+            box.repo_label.remove_css_class("warning")
 
-        row.set_child(box)
-        row.pkg_data = pkg_data
-        target_list.append(row)
-    
-    def add_empty_state_message(self, target_list):
-        """Add an empty state message to the specified list"""
-        row = Gtk.ListBoxRow(selectable=False, activatable=False)
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, halign=Gtk.Align.CENTER, valign=Gtk.Align.CENTER)
-        box.set_margin_top(60)
-        box.set_margin_bottom(60)
-        box.set_margin_start(24)
-        box.set_margin_end(24)
-        
+    def add_empty_state_message(self, target_stack):
+        """Show an empty state message in place of the list in the specified stack"""
         if self.current_tab == "installed":
-            icon = Gtk.Image.new_from_icon_name("package-x-generic-symbolic")
-            icon.set_pixel_size(64)
-            icon.add_css_class("dim-label")
+            icon_name = "package-x-generic-symbolic"
             title = "No Packages Installed"
             subtitle = "Install packages from the Available tab to see them here."
         elif self.current_tab == "flatpak":
-            icon = Gtk.Image.new_from_icon_name("application-x-addon-symbolic")
-            icon.set_pixel_size(64)
-            icon.add_css_class("dim-label")
+            icon_name = "application-x-addon-symbolic"
             if not self.check_fp():
                 title = "Flatpak Not Available"
                 subtitle = "Install Flatpak from Settings to use universal applications."
@@ -1944,9 +2152,7 @@ class PkgMan(Adw.ApplicationWindow):
                 title = "No Flatpak Apps Installed"
                 subtitle = "Install Flatpak applications to see them here."
         elif self.current_tab == "aur":
-            icon = Gtk.Image.new_from_icon_name("software-properties-symbolic")
-            icon.set_pixel_size(64)
-            icon.add_css_class("dim-label")
+            icon_name = "software-properties-symbolic"
             if not self.check_grimaur():
                 title = "Grimaur Not Available"
                 subtitle = "Grimaur is required for AUR support."
@@ -1957,18 +2163,31 @@ class PkgMan(Adw.ApplicationWindow):
                 title = "No AUR Packages Found"
                 subtitle = "Search for AUR packages to install, or view installed ones here."
         elif self.current_tab == "available":
-            icon = Gtk.Image.new_from_icon_name("system-search-symbolic")
-            icon.set_pixel_size(64)
-            icon.add_css_class("dim-label")
+            icon_name = "system-search-symbolic"
             title = "No Packages Found"
             subtitle = "Try adjusting your search terms or check your internet connection."
         else:  # all tab
-            icon = Gtk.Image.new_from_icon_name("view-list-symbolic")
-            icon.set_pixel_size(64)
-            icon.add_css_class("dim-label")
+            icon_name = "view-list-symbolic"
             title = "No Matching Packages"
             subtitle = "Try different search terms to find packages."
-        
+
+        # Typing through a run of no-match queries keeps hitting this; reuse the
+        # existing page when it already shows the same message
+        old_empty = target_stack.get_child_by_name("empty")
+        if old_empty and getattr(old_empty, "empty_key", None) == (icon_name, title, subtitle):
+            target_stack.set_visible_child_name("empty")
+            return
+
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, halign=Gtk.Align.CENTER, valign=Gtk.Align.CENTER)
+        box.set_margin_top(60)
+        box.set_margin_bottom(60)
+        box.set_margin_start(24)
+        box.set_margin_end(24)
+        box.empty_key = (icon_name, title, subtitle)
+
+        icon = Gtk.Image.new_from_icon_name(icon_name)
+        icon.set_pixel_size(64)
+        icon.add_css_class("dim-label")
         box.append(icon)
         
         title_label = Gtk.Label(label=title, halign=Gtk.Align.CENTER)
@@ -1978,17 +2197,16 @@ class PkgMan(Adw.ApplicationWindow):
         subtitle_label = Gtk.Label(label=subtitle, halign=Gtk.Align.CENTER, wrap=True)
         subtitle_label.add_css_class("dim-label")
         box.append(subtitle_label)
-        
-        row.set_child(box)
-        target_list.append(row)
 
-    def load_more_packages(self, button):
-        self.current_page += 1
-        self.refresh_list()
-    
-    def on_select(self, listbox, row):
-        if row:
-            self.selected = row.pkg_data
+        if old_empty:
+            target_stack.remove(old_empty)
+        target_stack.add_named(box, "empty")
+        target_stack.set_visible_child_name("empty")
+
+    def on_select(self, selection, param):
+        item = selection.get_selected_item()
+        if item:
+            self.selected = item.pkg_data
             installed = self.selected[2]
 
             self.info_btn.set_sensitive(True)
@@ -2040,6 +2258,10 @@ class PkgMan(Adw.ApplicationWindow):
             # Let the search handle the key
             return False
 
+        # ListView moves the selection and scrolls on arrow keys by itself
+        if isinstance(listbox, Gtk.ListView):
+            return False
+
         selected_row = listbox.get_selected_row()
         if not selected_row:
             # If nothing selected, select first row
@@ -2157,14 +2379,14 @@ class PkgMan(Adw.ApplicationWindow):
             vadj.set_value(new_value)
 
     def handle_package_action(self, button):
-        if not self.selected or len(self.selected) < 4:
+        if not self.selected:
             return
 
         installed = self.selected[2]
         pkg_type = self.selected[3]
 
         if pkg_type == "flatpak":
-            if len(self.selected) < 5:
+            if not self.selected[4]:
                 self.show_error("Invalid flatpak package data")
                 return
 
@@ -2179,17 +2401,16 @@ class PkgMan(Adw.ApplicationWindow):
                     cmd.insert(4, '-y')  # Insert -y before flathub
 
         elif pkg_type == "aur":
-            grimaur_path = os.path.join(os.path.dirname(__file__), 'grimaur-too/grimaur.py')
 
-            # Check if grimaur exists
-            if not os.path.exists(grimaur_path):
-                self.show_error(f"Grimaur not found at: {grimaur_path}")
+            # Check if grimaur exists (memoized by check_grimaur)
+            if not self.check_grimaur():
+                self.show_error(f"Grimaur not found at: {_GRIMAUR_PATH}")
                 return
 
             pkg_name = self.selected[0]
             if installed:
                 # Remove AUR package
-                cmd = ['sudo', '-u', self.sudo_user, 'python3', grimaur_path]
+                cmd = ['sudo', '-u', self.sudo_user, 'python3', _GRIMAUR_PATH]
                 dest_root = self.get_aur_dest_root()
                 if dest_root:
                     cmd.extend(['--dest-root', dest_root])
@@ -2200,7 +2421,7 @@ class PkgMan(Adw.ApplicationWindow):
                     cmd.append('--noconfirm')
             else:
                 # Install or Fetch AUR package
-                cmd = ['sudo', '-u', self.sudo_user, 'python3', grimaur_path]
+                cmd = ['sudo', '-u', self.sudo_user, 'python3', _GRIMAUR_PATH]
                 dest_root = self.get_aur_dest_root()
                 if dest_root:
                     cmd.extend(['--dest-root', dest_root])
@@ -2238,8 +2459,7 @@ class PkgMan(Adw.ApplicationWindow):
         """Handle system update - use grimaur if AUR is enabled, otherwise use pacman"""
         if self.check_grimaur() and self.get_grimaur_enabled():
             # Use grimaur update --global (updates system first, then AUR packages)
-            grimaur_path = os.path.join(os.path.dirname(__file__), 'grimaur-too/grimaur.py')
-            cmd = ['sudo', '-u', self.sudo_user, 'python3', grimaur_path, 'update', '--global']
+            cmd = ['sudo', '-u', self.sudo_user, 'python3', _GRIMAUR_PATH, 'update', '--global']
             if self.get_noconfirm_enabled():
                 cmd.append('--noconfirm')
             self.run_cmd(cmd)
@@ -2251,25 +2471,26 @@ class PkgMan(Adw.ApplicationWindow):
             self.run_cmd(cmd)
     
     def get_total_package_sizes(self):
-
-        # Get pacman package sizes
-        result = subprocess.run(['pacman', '-Qi'], capture_output=True, text=True, check=True)
+        """Get the formatted total installed size, recomputed only when the local db changes"""
+        stamp = _pacman_db_stamp('/var/lib/pacman/local')
+        if self._size_cache is not None and stamp is not None and self._size_cache[0] == stamp:
+            return self._size_cache[1]
+        total = self._sum_package_sizes()
+        self._size_cache = (stamp, total)
+        return total
+
+    def _sum_package_sizes(self):
+        # Stream the (multi-MB) -Qi dump as bytes; one compiled match per line
+        # replaces the startswith/split/replace parsing
         total_size = 0
-        
-        for line in result.stdout.split('\n'):
-            if line.startswith('Installed Size'):
-                size_str = line.split(':', 1)[1].strip()
-                # Parse size (handles KiB, MiB, GiB)
-                if 'KiB' in size_str:
-                    size = float(size_str.replace('KiB', '').strip()) * 1024
-                elif 'MiB' in size_str:
-                    size = float(size_str.replace('MiB', '').strip()) * 1024 * 1024
-                elif 'GiB' in size_str:
-                    size = float(size_str.replace('GiB', '').strip()) * 1024 * 1024 * 1024
-                else:
-                    continue
-                total_size += size
-        
+        with subprocess.Popen(['pacman', '-Qi'], stdout=subprocess.PIPE, bufsize=1 << 16) as proc:
+            for line in proc.stdout:
+                match = _INSTALLED_SIZE_RE.match(line)
+                if match:
+                    total_size += float(match[1]) * _SIZE_UNITS[match[2]]
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
         # Format the total size nicely
         if total_size > 1024**3:
             return f"{total_size / (1024**3):.1f} GiB"
@@ -2279,14 +2500,14 @@ class PkgMan(Adw.ApplicationWindow):
             return f"{total_size / 1024:.1f} KiB"
                 
     def show_package_info(self, button):
-        if not self.selected or len(self.selected) < 4:
+        if not self.selected:
             return
 
         # Store package info in local variables for thread safety
         pkg_name = self.selected[0]
         pkg_type = self.selected[3]
-        pkg_installed = self.selected[2] if len(self.selected) > 2 else False
-        pkg_app_id = self.selected[4] if len(self.selected) > 4 else None
+        pkg_installed = self.selected[2]
+        pkg_app_id = self.selected[4]
 
         dialog = Adw.Window(title=f"Info: {pkg_name}", transient_for=self, modal=True)
         dialog.set_default_size(600, 400)
@@ -2324,8 +2545,7 @@ class PkgMan(Adw.ApplicationWindow):
                         return
                 elif pkg_type == "aur":
                     # For AUR packages, use grimaur inspect
-                    grimaur_path = os.path.join(os.path.dirname(__file__), 'grimaur-too/grimaur.py')
-                    cmd = ['sudo', '-u', self.sudo_user, 'python3', grimaur_path, 'inspect', pkg_name, '--full']
+                    cmd = ['sudo', '-u', self.sudo_user, 'python3', _GRIMAUR_PATH, 'inspect', pkg_name, '--full']
                     result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, check=True)
                     # Add votes info if available from search cache
                     votes = self.aur_votes_cache.get(pkg_name)
@@ -2352,7 +2572,7 @@ class PkgMan(Adw.ApplicationWindow):
                 print(f"Debug - command failed: {error_msg}")
                 GLib.idle_add(self.display_info, toolbar_view, error_msg)
 
-        threading.Thread(target=load_info, daemon=True).start()
+        self._pool.submit(load_info)
     
     def display_info(self, toolbar_view, info_text):
         scroll = Gtk.ScrolledWindow(vexpand=True)
@@ -2400,62 +2620,38 @@ class PkgMan(Adw.ApplicationWindow):
             separator.set_margin_bottom(12)
             content_box.append(separator)
         
-        lines = info_text.strip().split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Handle both pacman format (Key : Value) and flatpak format (Key: Value)
-            if ':' in line and not line.startswith(' ') and not line.startswith('\t'):
-                # Split only on the first colon to handle values that contain colons
-                parts = line.split(':', 1)
-                if len(parts) == 2:
-                    key = parts[0].strip()
-                    value = parts[1].strip()
-                    
-                    row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-                    
-                    key_label = Gtk.Label(label=key, halign=Gtk.Align.START, valign=Gtk.Align.START)
-                    key_label.set_markup(f"<b>{key}</b>")
-                    key_label.set_size_request(120, -1)
-                    key_label.set_xalign(0.0)  # Left align within allocated space
-                    
-                    value_label = Gtk.Label(
-                        label=value, 
-                        halign=Gtk.Align.START, 
-                        valign=Gtk.Align.START, 
-                        hexpand=True, 
-                        wrap=True, 
-                        selectable=True
-                    )
-                    value_label.set_xalign(0.0)  # Left align within allocated space
-                    
-                    row_box.append(key_label)
-                    row_box.append(value_label)
-                    content_box.append(row_box)
-            else:
-                # Handle continuation lines or lines without colons
-                if line.startswith(' ') or line.startswith('\t'):
-                    # This is likely a continuation of the previous field
-                    continue_label = Gtk.Label(
-                        label=line.strip(), 
-                        halign=Gtk.Align.START, 
-                        hexpand=True, 
-                        wrap=True, 
-                        selectable=True
-                    )
-                    continue_label.set_xalign(0.0)
-                    continue_label.set_margin_start(132)  # Indent to align with values
-                    content_box.append(continue_label)
-                else:
+        # One two-column grid for all fields instead of a Box per row, so keys
+        # line up without a fixed width and GTK lays out a single container
+        fields = parse_info_fields(info_text)
+        if fields:
+            grid = Gtk.Grid(column_spacing=12, row_spacing=6)
+            for row, (key, value) in enumerate(fields):
+                if key is None:
                     # Lines without colons (like section headers)
-                    section_label = Gtk.Label(label=line, halign=Gtk.Align.START, wrap=True, selectable=True)
-                    section_label.set_markup(f"<b>{line}</b>")
+                    section_label = Gtk.Label(label=value, halign=Gtk.Align.START, wrap=True, selectable=True)
+                    section_label.set_markup(f"<b>{GLib.markup_escape_text(value)}</b>")
                     section_label.set_xalign(0.0)
-                    content_box.append(section_label)
-        
+                    grid.attach(section_label, 0, row, 2, 1)
+                    continue
+
+                key_label = Gtk.Label(label=key, halign=Gtk.Align.START, valign=Gtk.Align.START)
+                key_label.set_markup(f"<b>{GLib.markup_escape_text(key)}</b>")
+                key_label.set_xalign(0.0)  # Left align within allocated space
+
+                value_label = Gtk.Label(
+                    label=value,
+                    halign=Gtk.Align.START,
+                    valign=Gtk.Align.START,
+                    hexpand=True,
+                    wrap=True,
+                    selectable=True
+                )
+                value_label.set_xalign(0.0)  # Left align within allocated space
+
+                grid.attach(key_label, 0, row, 1, 1)
+                grid.attach(value_label, 1, row, 1, 1)
+            content_box.append(grid)
+
         # If no structured content was found, show the raw text
         if not content_box.get_first_child():
             raw_label = Gtk.Label(
@@ -2580,14 +2776,21 @@ class PkgMan(Adw.ApplicationWindow):
 
         # Start progress bar with accelerating pulse effect
         pulse_position = [0.0]  # Current position (0.0 to 1.0)
-        pulse_speed = [0.01]    # Current speed, will accelerate
+        pulse_speed = [0.01]    # Current speed per 16ms step, will accelerate
+        last_frame = [None]     # Frame time of the previous tick (µs)
+
+        def accelerating_pulse(widget, frame_clock):
+            # Tick callbacks follow the frame clock, so scale by elapsed time
+            # to keep the same speed regardless of refresh rate
+            now = frame_clock.get_frame_time()
+            steps = 1.0 if last_frame[0] is None else (now - last_frame[0]) / 16000
+            last_frame[0] = now
 
-        def accelerating_pulse():
             # Update position
-            pulse_position[0] += pulse_speed[0]
+            pulse_position[0] += pulse_speed[0] * steps
 
             # Accelerate as it moves
-            pulse_speed[0] += 0.0005
+            pulse_speed[0] += 0.0005 * steps
 
             # Reset when reaching the end
             if pulse_position[0] >= 1.0:
@@ -2597,7 +2800,9 @@ class PkgMan(Adw.ApplicationWindow):
             progress.set_fraction(pulse_position[0])
             return True  # Continue animation
 
-        pulse_id = GLib.timeout_add(16, accelerating_pulse)  # ~60fps
+        # Driven by the frame clock instead of a 16ms timer: updates coalesce
+        # with repaints and stop by themselves once the dialog is destroyed
+        pulse_id = progress.add_tick_callback(accelerating_pulse)
 
         # Track terminal PID for cleanup
         terminal_pid = None
@@ -2608,18 +2813,38 @@ class PkgMan(Adw.ApplicationWindow):
             # Mark process as finished
             dialog.process_finished = True
 
+            # VTE has already reaped the child; record its status so poll() doesn't
+            # need to probe the pid (which may be reused by then)
+            proc_obj = getattr(term, "proc", None)
+            if proc_obj is not None:
+                proc_obj.returncode = status
+                if proc_obj in self.running_processes:
+                    self.running_processes.remove(proc_obj)
+
+            # child-exited is emitted on the main loop, so update widgets directly
             # Stop progress bar pulsing and set to full
-            GLib.source_remove(pulse_id)
-            GLib.idle_add(lambda: progress.set_fraction(1.0))
+            progress.remove_tick_callback(pulse_id)
+            progress.set_fraction(1.0)
 
             # Update status and progress bar color
             if status == 0:
-                GLib.idle_add(lambda: progress.add_css_class("success"))
-                GLib.idle_add(lambda: status_label.set_text("✓ Success"))
-                GLib.timeout_add(500, self.update_package_status)
+                progress.add_css_class("success")
+                status_label.set_text("✓ Success")
+                # Flatpak commands only change flatpak state; everything else
+                # (pacman, grimaur) can touch repo and foreign packages
+                program = cmd[3] if cmd[0] == 'sudo' and len(cmd) > 3 else cmd[0]
+                sources = ("flatpak",) if program == 'flatpak' else ("pacman", "aur")
+                # The command may have installed or removed flatpak itself;
+                # other commands leave the cached checks valid
+                if 'flatpak' in cmd:
+                    self.invalidate_flatpak_checks()
+                    # e.g. pacman -S/-R flatpak also changes what the Flatpak tab shows
+                    if "flatpak" not in sources:
+                        sources += ("flatpak",)
+                GLib.timeout_add(500, self.update_package_status, sources)
             else:
-                GLib.idle_add(lambda: progress.add_css_class("error"))
-                GLib.idle_add(lambda: status_label.set_text(f"✗ Error (exit code: {status})"))
+                progress.add_css_class("error")
+                status_label.set_text(f"✗ Error (exit code: {status})")
 
         terminal.connect("child-exited", on_child_exited)
 
@@ -2639,7 +2864,7 @@ class PkgMan(Adw.ApplicationWindow):
                 (terminal, status_label, pulse_id, progress)  # user data
             )
         except Exception as e:
-            GLib.source_remove(pulse_id)
+            progress.remove_tick_callback(pulse_id)
             progress.set_fraction(1.0)
             progress.add_css_class("error")
             status_label.set_text(f"✗ Failed to spawn command: {e}")
@@ -2649,18 +2874,22 @@ class PkgMan(Adw.ApplicationWindow):
         term, status_label, pulse_id, progress = user_data
 
         if error:
-            GLib.source_remove(pulse_id)
-            GLib.idle_add(lambda: progress.set_fraction(1.0))
-            GLib.idle_add(lambda: progress.add_css_class("error"))
-            GLib.idle_add(lambda: status_label.set_text(f"✗ Error: {error}"))
+            # Spawn callbacks run on the main loop, so update widgets directly
+            progress.remove_tick_callback(pulse_id)
+            progress.set_fraction(1.0)
+            progress.add_css_class("error")
+            status_label.set_text(f"✗ Error: {error}")
             return
 
         # Create a pseudo-process object for tracking
         class TerminalProcess:
             def __init__(self, pid):
                 self.pid = pid
+                self.returncode = None  # Set from the terminal's child-exited signal
 
             def poll(self):
+                if self.returncode is not None:
+                    return self.returncode
                 # Check if process is still running
                 try:
                     os.kill(self.pid, 0)
@@ -2692,6 +2921,7 @@ class PkgMan(Adw.ApplicationWindow):
         # Track the process
         proc_obj = TerminalProcess(pid)
         self.running_processes.append(proc_obj)
+        term.proc = proc_obj
 
     def install_pacman_contrib(self, dialog):
         """Install pacman-contrib and refresh settings dialog"""
@@ -2700,6 +2930,9 @@ class PkgMan(Adw.ApplicationWindow):
         def check_and_reopen():
             """Poll for installation completion and reopen settings"""
             def check_installation_complete():
+                # The installed set is keyed on the local db stamp, which changes
+                # once pacman-contrib lands; only the memoized answer needs resetting
+                invalidate_pacman_contrib_cache()
                 if check_pacman_contrib():
                     # pacman-contrib is now installed
                     self.show_settings(None)
@@ -2741,6 +2974,8 @@ class PkgMan(Adw.ApplicationWindow):
 
             GLib.idle_add(self.display_dependency_results, toolbar_view, heavy_packages)
 
+        # pactree over every package can run for minutes, so keep it on its own
+        # daemon thread rather than tying up a pool worker and delaying exit
         threading.Thread(target=analyze, daemon=True).start()
 
     def display_dependency_results(self, toolbar_view, heavy_packages):
@@ -2798,6 +3033,9 @@ class PkgMan(Adw.ApplicationWindow):
             key_controller.connect("key-pressed", self.on_list_key_pressed, listbox)
             listbox.add_controller(key_controller)
 
+            # Parse IgnorePkg once rather than re-scanning pacman.conf per row
+            ignored = ignorepkg_set()
+
             for pkg_name, dep_count in heavy_packages:
                 row = Adw.ActionRow(
                     title=pkg_name,
@@ -2805,7 +3043,7 @@ class PkgMan(Adw.ApplicationWindow):
                 )
 
                 # Check if already in IgnorePkg
-                if is_in_ignorepkg(pkg_name):
+                if pkg_name in ignored:
                     # Show remove button
                     remove_btn = Gtk.Button(label="Remove from IgnorePkg")
                     remove_btn.set_valign(Gtk.Align.CENTER)
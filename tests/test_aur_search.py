@@ -0,0 +1,48 @@
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("gi")
+main = pytest.importorskip("main")
+
+
+class FakeWindow:
+    """Just the attributes search_aur_packages touches"""
+
+    search_aur_packages = main.PkgMan.search_aur_packages
+
+    def __init__(self):
+        self.sudo_user = "user"
+        self.aur_search_cache = {}
+        self.aur_votes_cache = {}
+        self.installed_aur = set()
+
+    def check_grimaur(self):
+        return True
+
+    def get_grimaur_enabled(self):
+        return True
+
+    def refresh_installed_aur(self):
+        pass
+
+
+def test_repeated_aur_search_replays_cache(monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return SimpleNamespace(returncode=0, stdout="1) yay-bin 12.3-1 [aur rpc, 14 votes]\n    Yet another yogurt\n")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    window = FakeWindow()
+
+    first = window.search_aur_packages("yay")
+    window.installed_aur = {"yay-bin"}
+    second = window.search_aur_packages("yay")
+
+    assert len(calls) == 1
+    assert first == [("yay-bin", "aur", False, "aur", None)]
+    assert second == [("yay-bin", "aur", True, "aur", None)]
+    assert window.aur_votes_cache == {"yay-bin": 14}